@@ -6,25 +6,79 @@ This module handles OAuth2 authentication with the Gmail API.
 import json
 import logging
 import os
-import pickle
-import platform
+import re
 import subprocess
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# Lazily imported google-auth symbols, populated on first use by
+# _import_google_auth: importing this module for KeychainManager alone
+# shouldn't drag in the whole google-auth stack (cryptography, pyasn1).
+# Module-level names are kept so mock.patch targets keep working.
+Credentials: Any = None
+InstalledAppFlow: Any = None
+Request: Any = None
+
+
+def _import_google_auth() -> None:
+    """Bind the google-auth symbols this module defers importing."""
+    global Credentials, InstalledAppFlow, Request
+    # Guarded per symbol so a test that has patched one of them isn't
+    # clobbered when another triggers the import
+    if Credentials is None:
+        from google.oauth2.credentials import Credentials as _Credentials
+
+        Credentials = _Credentials
+    if InstalledAppFlow is None:
+        from google_auth_oauthlib.flow import InstalledAppFlow as _InstalledAppFlow
+
+        InstalledAppFlow = _InstalledAppFlow
+    if Request is None:
+        from google.auth.transport.requests import Request as _Request
+
+        Request = _Request
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 # Gmail API scopes
 # https://developers.google.com/gmail/api/auth/scopes
-SCOPES = [
-    "https://www.googleapis.com/auth/gmail.readonly",
-    "https://www.googleapis.com/auth/gmail.modify",
-]
+# Immutable tuple of interned strings: scope comparisons hash once and
+# the constant is shareable across threads without defensive copies
+SCOPES = tuple(
+    sys.intern(scope)
+    for scope in (
+        "https://www.googleapis.com/auth/gmail.readonly",
+        "https://www.googleapis.com/auth/gmail.modify",
+    )
+)
 
 logger = logging.getLogger(__name__)
 
+# The platform cannot change during the process lifetime; sys.platform
+# is a constant the interpreter already computed
+_IS_DARWIN = sys.platform == "darwin"
+
+# The security CLI's wording for a duplicate item varies between macOS
+# releases; compiled once so store_token doesn't rebuild it per call
+_DUPLICATE_PATTERNS = re.compile(r"already exists|duplicate item|errSecDuplicateItem")
+
+# In-process credentials cache so repeated get_credentials calls within
+# one run skip Keychain and token-file I/O entirely. Entries are dropped
+# on force_refresh and replaced whenever new credentials are obtained.
+_credentials_cache: Dict[Tuple[str, Optional[str]], Credentials] = {}
+
+
+def _quote_security_arg(arg: str) -> str:
+    """Quote one argument for security's interactive command parser.
+
+    Args:
+        arg: Raw argument value
+
+    Returns:
+        The argument wrapped in double quotes with escapes applied
+    """
+    return '"' + arg.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
 
 class KeychainManager:
     """Manager for macOS Keychain integration."""
@@ -37,6 +91,16 @@ class KeychainManager:
         """
         self.service_name = service_name
         self.enabled = self._is_supported()
+        # Constant argv prefixes built once; only the account (and the
+        # secret itself) vary between calls
+        self._store_prefix = ("security", "add-generic-password", "-s", service_name)
+        self._find_prefix = ("security", "find-generic-password", "-s", service_name)
+        self._delete_prefix = (
+            "security",
+            "delete-generic-password",
+            "-s",
+            service_name,
+        )
 
     def _is_supported(self) -> bool:
         """Check if Keychain is supported on this system.
@@ -44,7 +108,7 @@ class KeychainManager:
         Returns:
             True if supported, False otherwise
         """
-        return platform.system() == "Darwin"
+        return _IS_DARWIN
 
     def store_token(self, account: str, token_data: Dict[str, Any]) -> bool:
         """Store a token in Keychain.
@@ -65,33 +129,51 @@ class KeychainManager:
             token_json = json.dumps(token_data)
 
             # Use security command-line tool to store in Keychain
-            cmd = [
-                "security",
-                "add-generic-password",
-                "-a",
-                account,
-                "-s",
-                self.service_name,
-                "-w",
-                token_json,
-                "-U",  # Update if exists
-            ]
+            # (-U updates in place if the item exists)
+            cmd = (*self._store_prefix, "-a", account, "-w", token_json, "-U")
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
 
             if result.returncode != 0:
                 # If the item already exists, try to update it
-                if "already exists" in result.stderr:
-                    logger.debug("Token already exists in Keychain, updating")
-                    cmd = [
-                        "security",
-                        "delete-generic-password",
-                        "-a",
-                        account,
-                        "-s",
-                        self.service_name,
-                    ]
-                    subprocess.run(cmd, capture_output=True, check=False)
-                    return self.store_token(account, token_data)
+                if _DUPLICATE_PATTERNS.search(result.stderr):
+                    logger.debug("Token already exists in Keychain, replacing")
+                    # Fuse the delete and re-add into one security
+                    # invocation via interactive batch mode instead of
+                    # forking twice more
+                    script = "{}\n{}\n".format(
+                        " ".join(
+                            [
+                                "delete-generic-password",
+                                "-a",
+                                _quote_security_arg(account),
+                                "-s",
+                                _quote_security_arg(self.service_name),
+                            ]
+                        ),
+                        " ".join(
+                            [
+                                "add-generic-password",
+                                "-a",
+                                _quote_security_arg(account),
+                                "-s",
+                                _quote_security_arg(self.service_name),
+                                "-w",
+                                _quote_security_arg(token_json),
+                            ]
+                        ),
+                    )
+                    result = subprocess.run(
+                        ["security", "-i"],
+                        input=script,
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                    )
+                    if result.returncode != 0:
+                        logger.error(
+                            f"Error replacing token in Keychain: {result.stderr}"
+                        )
+                        return False
                 else:
                     logger.error(f"Error storing token in Keychain: {result.stderr}")
                     return False
@@ -118,15 +200,8 @@ class KeychainManager:
 
         try:
             # Use security command-line tool to retrieve from Keychain
-            cmd = [
-                "security",
-                "find-generic-password",
-                "-a",
-                account,
-                "-s",
-                self.service_name,
-                "-w",  # Get password
-            ]
+            # (-w prints just the password)
+            cmd = (*self._find_prefix, "-a", account, "-w")
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
 
             if result.returncode != 0:
@@ -158,14 +233,7 @@ class KeychainManager:
 
         try:
             # Use security command-line tool to delete from Keychain
-            cmd = [
-                "security",
-                "delete-generic-password",
-                "-a",
-                account,
-                "-s",
-                self.service_name,
-            ]
+            cmd = (*self._delete_prefix, "-a", account)
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
 
             if result.returncode != 0:
@@ -191,7 +259,7 @@ def get_credentials(
 
     Args:
         credentials_path: Path to the credentials.json file
-        token_path: Path to save the token.pickle file (defaults to same directory)
+        token_path: Path to save the token file (defaults to same directory)
         force_refresh: Force reauthentication even if token exists
         use_keychain: Whether to use macOS Keychain for token storage
         keychain_service_name: Service name for Keychain storage
@@ -206,10 +274,21 @@ def get_credentials(
     if not os.path.exists(credentials_path):
         raise FileNotFoundError(f"Credentials file not found: {credentials_path}")
 
+    _import_google_auth()
+
     # If token_path is not specified, use the same directory as credentials
     if token_path is None:
         token_path = str(Path(credentials_path).parent / "token.pickle")
 
+    cache_key = (os.path.abspath(credentials_path), token_path)
+    if force_refresh:
+        _credentials_cache.pop(cache_key, None)
+    else:
+        cached = _credentials_cache.get(cache_key)
+        if cached is not None and cached.valid:
+            logger.debug("Using in-process cached credentials")
+            return cached
+
     credentials = None
     keychain_manager = None
     account_id = None
@@ -233,12 +312,18 @@ def get_credentials(
                     credentials = None
 
     # If not using Keychain or Keychain retrieval failed, try file-based storage
-    if not credentials and os.path.exists(token_path) and not force_refresh:
-        logger.debug(f"Loading existing token from {token_path}")
+    if not credentials and not force_refresh:
         try:
-            with open(token_path, "rb") as token:
-                credentials = pickle.load(token)
-        except (pickle.UnpicklingError, EOFError) as e:
+            # Open directly instead of checking existence first: one
+            # stat syscall instead of two, with EAFP covering the miss.
+            # Tokens are stored as the JSON that google-auth natively
+            # produces, so loading is a plain json.load
+            with open(token_path) as token:
+                logger.debug(f"Loading existing token from {token_path}")
+                credentials = Credentials.from_authorized_user_info(json.load(token))
+        except FileNotFoundError:
+            logger.debug(f"No token file at {token_path}")
+        except (OSError, ValueError) as e:
             logger.warning(f"Error loading token: {e}")
             # Continue to get new credentials
 
@@ -279,12 +364,25 @@ def get_credentials(
             # Always save to file as fallback
             logger.debug(f"Saving credentials to {token_path}")
             os.makedirs(os.path.dirname(token_path), exist_ok=True)
-            with open(token_path, "wb") as token:
-                pickle.dump(credentials, token)
+            with open(token_path, "w") as token:
+                token.write(credentials.to_json())
+
+    if credentials:
+        _credentials_cache[cache_key] = credentials
 
     return credentials
 
 
+def _clear_credentials_cache() -> None:
+    """Drop all in-process cached credentials (primarily for tests)."""
+    _credentials_cache.clear()
+
+
+# Mirror the functools.lru_cache interface so callers and tests can
+# invalidate with the familiar spelling
+get_credentials.cache_clear = _clear_credentials_cache  # type: ignore[attr-defined]
+
+
 def migrate_to_keychain(
     token_path: str,
     keychain_service_name: str = "Gmail to Bear",
@@ -293,24 +391,18 @@ def migrate_to_keychain(
     """Migrate token from file to Keychain.
 
     Args:
-        token_path: Path to the token.pickle file
+        token_path: Path to the token file
         keychain_service_name: Service name for Keychain storage
         delete_file: Whether to delete the token file after migration
 
     Returns:
         True if successful, False otherwise
     """
-    if not os.path.exists(token_path):
-        logger.error(f"Token file not found: {token_path}")
-        return False
-
     try:
-        # Load token from file
-        with open(token_path, "rb") as token_file:
-            credentials = pickle.load(token_file)
-
-        # Convert to token data
-        token_data = json.loads(credentials.to_json())
+        # Load token data from file (stored as JSON); opening directly
+        # doubles as the existence check
+        with open(token_path) as token_file:
+            token_data = json.load(token_file)
 
         # Store in Keychain
         keychain_manager = KeychainManager(keychain_service_name)
@@ -328,6 +420,9 @@ def migrate_to_keychain(
 
         return success
 
+    except FileNotFoundError:
+        logger.error(f"Token file not found: {token_path}")
+        return False
     except Exception as e:
         logger.error(f"Error migrating token to Keychain: {e}")
         return False
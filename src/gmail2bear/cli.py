@@ -4,6 +4,7 @@ This module provides the command-line interface for the Gmail to Bear integratio
 """
 
 import argparse
+import functools
 import logging
 import os
 import platform
@@ -87,14 +88,15 @@ def setup_logging(config_path: str, level: int = logging.INFO) -> None:
             logger.error(f"Failed to set up file logging: {e}")
 
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
-    """Parse command-line arguments.
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser.
 
-    Args:
-        args: Command-line arguments (optional)
+    Cached because the parser is pure configuration: rebuilding it per
+    parse_args call repeats every add_argument for no benefit.
 
     Returns:
-        Parsed arguments
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(description="Gmail to Bear integration")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -231,7 +233,19 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     )
 
     # Parse arguments
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        args: Command-line arguments (optional)
+
+    Returns:
+        Parsed arguments
+    """
+    return _build_parser().parse_args(args)
 
 
 def handle_service_command(args: argparse.Namespace) -> int:
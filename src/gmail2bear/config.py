@@ -4,12 +4,41 @@ This module handles loading and parsing the configuration file.
 """
 
 import configparser
+import functools
 import logging
 import os
-from typing import Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
 
 logger = logging.getLogger(__name__)
 
+# Type variable for the return type of a cached getter
+T = TypeVar("T")
+
+
+def _cached(getter: Callable[..., T]) -> Callable[..., T]:
+    """Cache a zero-argument getter's value until the next config reload.
+
+    The processor calls these getters once per email in the hot loop;
+    caching avoids re-running configparser lookups and fallback handling
+    for values that only change when the file is reloaded.
+
+    Args:
+        getter: Config method taking only self
+
+    Returns:
+        Wrapped method that memoizes per instance
+    """
+    name = getter.__name__
+
+    @functools.wraps(getter)
+    def wrapper(self: "Config") -> T:
+        cache = self._cache
+        if name not in cache:
+            cache[name] = getter(self)
+        return cast(T, cache[name])
+
+    return wrapper
+
 
 class Config:
     """Configuration handler for Gmail to Bear."""
@@ -22,16 +51,47 @@ class Config:
         """
         self.config_path = config_path
         self.config = configparser.ConfigParser(interpolation=None)
+        self._cache: Dict[str, Any] = {}
         self.loaded = self._load_config()
         self.last_modified_time = self._get_file_modified_time()
         self._file_watcher_enabled = False
 
+    @classmethod
+    def from_string(cls, text: str) -> "Config":
+        """Build a configuration from an in-memory INI string.
+
+        Skips the filesystem entirely; change detection and reloading
+        are no-ops since there is no file to watch. Intended for tests
+        and embedded defaults.
+
+        Args:
+            text: Configuration contents in INI format
+
+        Returns:
+            Config instance backed by the parsed string
+        """
+        instance = cls.__new__(cls)
+        instance.config_path = ""
+        instance.config = configparser.ConfigParser(interpolation=None)
+        instance._cache = {}
+        try:
+            instance.config.read_string(text)
+            instance.loaded = True
+        except configparser.Error as e:
+            logger.error(f"Error parsing configuration string: {e}")
+            instance.loaded = False
+        instance.last_modified_time = 0
+        instance._file_watcher_enabled = False
+        return instance
+
     def _load_config(self) -> bool:
         """Load the configuration file.
 
         Returns:
             True if successful, False otherwise
         """
+        self._cache.clear()
+
         if not os.path.exists(self.config_path):
             logger.error(f"Configuration file not found: {self.config_path}")
             return False
@@ -111,6 +171,7 @@ class Config:
             return True
         return False
 
+    @_cached
     def get_sender_email(self) -> Union[str, List[str], None]:
         """Get the sender email(s) to monitor.
 
@@ -132,6 +193,7 @@ class Config:
             logger.error(f"Error getting sender email from config: {e}")
             return None
 
+    @_cached
     def get_poll_interval(self) -> int:
         """Get the polling interval in seconds.
 
@@ -144,6 +206,7 @@ class Config:
             logger.warning(f"Error getting poll interval from config: {e}")
             return 300
 
+    @_cached
     def should_archive_emails(self) -> bool:
         """Check if emails should be archived after processing.
 
@@ -156,6 +219,7 @@ class Config:
             logger.warning(f"Error getting archive_emails from config: {e}")
             return False
 
+    @_cached
     def get_note_title_template(self) -> str:
         """Get the Bear note title template.
 
@@ -170,6 +234,7 @@ class Config:
             logger.warning(f"Error getting note title template from config: {e}")
             return "Email: {subject}"
 
+    @_cached
     def get_note_body_template(self) -> str:
         """Get the Bear note body template.
 
@@ -197,6 +262,7 @@ class Config:
             logger.warning(f"Error getting note body template from config: {e}")
             return default_template
 
+    @_cached
     def get_tags(self) -> List[str]:
         """Get the tags to add to Bear notes.
 
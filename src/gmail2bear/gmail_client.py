@@ -7,9 +7,21 @@ import base64
 import logging
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
-
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import httplib2  # type: ignore
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp  # type: ignore
 from googleapiclient.discovery import build  # type: ignore
 from googleapiclient.errors import HttpError  # type: ignore
 
@@ -28,21 +40,49 @@ class GmailClient:
     # Maximum number of retries for transient errors
     MAX_RETRIES = 3
 
-    def __init__(self, credentials: Credentials):
+    # Maximum number of operations per Gmail batch HTTP request
+    BATCH_SIZE = 100
+
+    # Maximum number of message IDs per batchModify request
+    BATCH_MODIFY_SIZE = 1000
+
+    # Timeout for HTTP requests in seconds
+    HTTP_TIMEOUT = 30
+
+    def __init__(self, credentials: Credentials, http: Optional[AuthorizedHttp] = None):
         """Initialize the Gmail client.
 
         Args:
             credentials: Google OAuth2 credentials
+            http: Authorized HTTP transport to use (optional, a pooled
+                keep-alive transport is created by default)
         """
-        self.service = build("gmail", "v1", credentials=credentials)
+        if http is None:
+            # Use a single authorized transport for all API calls so the
+            # underlying TLS connection is kept alive across requests
+            # instead of paying a TCP+TLS handshake per call
+            http = AuthorizedHttp(
+                credentials, http=httplib2.Http(timeout=self.HTTP_TIMEOUT)
+            )
+        self.http = http
+        self.service = build("gmail", "v1", http=http, cache_discovery=False)
         self.user_id = "me"  # 'me' refers to the authenticated user
+        self._label_ids: Dict[str, str] = {}  # label name -> label ID cache
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections held by the client."""
+        try:
+            self.http.close()
+        except Exception as e:
+            logger.debug(f"Error closing HTTP connections: {e}")
 
     def get_emails_from_sender(
         self,
         sender_email: Union[str, List[str]],
         max_results: int = 10,
         only_unread: bool = False,
-        processed_ids: Optional[List[str]] = None,
+        processed_ids: Optional[Collection[str]] = None,
+        extra_query: str = "",
     ) -> List[Dict[str, Any]]:
         """Get emails from specific sender(s).
 
@@ -50,7 +90,10 @@ class GmailClient:
             sender_email: Email address(es) of the sender(s)
             max_results: Maximum number of emails to retrieve
             only_unread: Only retrieve unread emails
-            processed_ids: List of already processed email IDs to exclude
+            processed_ids: Already processed email IDs to exclude; pass a
+                set for O(1) membership checks
+            extra_query: Additional Gmail query terms, e.g. a label
+                exclusion to filter processed emails server-side
 
         Returns:
             List of email dictionaries with id, subject, body, date, and sender
@@ -66,6 +109,9 @@ class GmailClient:
         if only_unread:
             query += " is:unread"
 
+        if extra_query:
+            query += f" {extra_query}"
+
         logger.debug(f"Searching for emails with query: {query}")
 
         try:
@@ -97,29 +143,9 @@ class GmailClient:
                     logger.info(f"No new emails found from {sender_email}")
                 return []
 
-            # Get full message details for each ID
-            emails = []
-            for message in messages:
-                msg_id = message["id"]
-                logger.debug(f"Retrieving email with ID: {msg_id}")
-
-                try:
-                    email_data = self._get_email_data(msg_id)
-                    if email_data:
-                        emails.append(email_data)
-                except HttpError as error:
-                    status_code = error.resp.status
-                    logger.error(
-                        f"Error retrieving email {msg_id}: HTTP {status_code} - {error}"
-                    )
-
-                    # If this is a rate limit error, pause briefly before continuing
-                    if status_code == 429:
-                        logger.warning("Rate limit exceeded, pausing before continuing")
-                        time.sleep(2)
-                    continue
-
-            return emails
+            # Fetch full message details in batched HTTP requests
+            # instead of one round trip per message
+            return self._get_emails_batch([message["id"] for message in messages])
 
         except HttpError as error:
             status_code = error.resp.status
@@ -177,6 +203,143 @@ class GmailClient:
         # This should also never happen
         raise RuntimeError("Unexpected error in _execute_with_retry")
 
+    def get_emails_by_ids(self, msg_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get full email data for specific message IDs.
+
+        Args:
+            msg_ids: Gmail message IDs to retrieve
+
+        Returns:
+            List of email dictionaries, in the order of msg_ids
+        """
+        if not msg_ids:
+            return []
+
+        try:
+            return self._get_emails_batch(msg_ids)
+        except HttpError as error:
+            status_code = error.resp.status
+            logger.error(f"Error retrieving emails: HTTP {status_code} - {error}")
+            return []
+
+    def get_new_message_ids_since(
+        self, history_id: str
+    ) -> Optional[Tuple[List[str], str]]:
+        """Get IDs of messages added to the mailbox since a history ID.
+
+        This is an incremental alternative to a full message list query:
+        the response only covers mailbox changes after ``history_id``.
+
+        Args:
+            history_id: History ID from a previous sync
+
+        Returns:
+            Tuple of (new message IDs, latest history ID), or None if the
+            history ID has expired and a full query is required
+        """
+        try:
+            msg_ids: List[str] = []
+            latest_history_id = history_id
+            page_token: Optional[str] = None
+
+            while True:
+                request = (
+                    self.service.users()
+                    .history()
+                    .list(
+                        userId=self.user_id,
+                        startHistoryId=history_id,
+                        historyTypes=["messageAdded"],
+                        pageToken=page_token,
+                    )
+                )
+                response = self._execute_with_retry(request.execute)
+
+                latest_history_id = str(response.get("historyId", latest_history_id))
+                for record in response.get("history", []):
+                    for added in record.get("messagesAdded", []):
+                        msg_ids.append(added["message"]["id"])
+
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+
+            return msg_ids, latest_history_id
+        except HttpError as error:
+            status_code = error.resp.status
+            if status_code == 404:
+                # Gmail only keeps history for about a week; the caller
+                # must fall back to a full query
+                logger.info("Gmail history ID expired, full sync required")
+            else:
+                logger.error(
+                    f"Error listing mailbox history: HTTP {status_code} - {error}"
+                )
+            return None
+
+    def get_latest_history_id(self) -> Optional[str]:
+        """Get the current mailbox history ID.
+
+        Returns:
+            History ID string, or None if the lookup fails
+        """
+        try:
+            profile = self._execute_with_retry(
+                lambda: self.service.users().getProfile(userId=self.user_id).execute()
+            )
+            history_id = profile.get("historyId")
+            return str(history_id) if history_id is not None else None
+        except HttpError as error:
+            status_code = error.resp.status
+            logger.error(f"Error getting mailbox profile: HTTP {status_code} - {error}")
+            return None
+
+    def _get_emails_batch(self, msg_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get email data for multiple message IDs with batched requests.
+
+        Args:
+            msg_ids: Gmail message IDs to retrieve
+
+        Returns:
+            List of email dictionaries, in the order of msg_ids
+        """
+        emails_by_id: Dict[str, Dict[str, Any]] = {}
+
+        def _collect(
+            request_id: str,
+            response: Optional[Dict[str, Any]],
+            exception: Optional[Exception],
+        ) -> None:
+            if exception is not None:
+                if isinstance(exception, HttpError):
+                    status_code = exception.resp.status
+                    logger.error(
+                        f"Error retrieving email {request_id}: "
+                        f"HTTP {status_code} - {exception}"
+                    )
+                else:
+                    logger.error(f"Error retrieving email {request_id}: {exception}")
+                return
+            if response:
+                email_data = self._parse_message(request_id, response)
+                if email_data:
+                    emails_by_id[request_id] = email_data
+
+        # One batch request replaces up to BATCH_SIZE individual get calls
+        for start in range(0, len(msg_ids), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for msg_id in msg_ids[start : start + self.BATCH_SIZE]:
+                logger.debug(f"Queueing email fetch for ID: {msg_id}")
+                batch.add(
+                    self.service.users()
+                    .messages()
+                    .get(userId=self.user_id, id=msg_id, format="full"),
+                    request_id=msg_id,
+                )
+            self._execute_with_retry(batch.execute)
+
+        return [emails_by_id[msg_id] for msg_id in msg_ids if msg_id in emails_by_id]
+
     def _get_email_data(self, msg_id: str) -> Optional[Dict[str, Any]]:
         """Get email data for a specific message ID.
 
@@ -195,52 +358,66 @@ class GmailClient:
                 .execute()
             )
 
-            # Extract headers
-            headers = {
-                header["name"].lower(): header["value"]
-                for header in message["payload"]["headers"]
-            }
+            return self._parse_message(msg_id, message)
+        except HttpError as error:
+            status_code = error.resp.status
+            logger.error(
+                f"Error retrieving email {msg_id}: HTTP {status_code} - {error}"
+            )
+            return None
+
+    def _parse_message(
+        self, msg_id: str, message: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a Gmail message resource into an email dictionary.
 
-            # Get subject, from, and date
-            subject = headers.get("subject", "(No Subject)")
-            sender = headers.get("from", "")
-            date_str = headers.get("date", "")
+        Args:
+            msg_id: Gmail message ID
+            message: Gmail message resource
 
-            # Parse date
+        Returns:
+            Dictionary with email data
+        """
+        # Extract headers
+        headers = {
+            header["name"].lower(): header["value"]
+            for header in message["payload"]["headers"]
+        }
+
+        # Get subject, from, and date
+        subject = headers.get("subject", "(No Subject)")
+        sender = headers.get("from", "")
+        date_str = headers.get("date", "")
+
+        # Parse date
+        try:
+            # Try to parse various date formats
+            date_obj = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
+        except ValueError:
             try:
-                # Try to parse various date formats
-                date_obj = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
+                date_obj = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %Z")
             except ValueError:
-                try:
-                    date_obj = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %Z")
-                except ValueError:
-                    # Fallback to current date if parsing fails
-                    date_obj = datetime.now()
-                    logger.warning(
-                        f"Could not parse date '{date_str}' for email {msg_id}, using current time"
-                    )
-
-            date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
+                # Fallback to current date if parsing fails
+                date_obj = datetime.now()
+                logger.warning(
+                    f"Could not parse date '{date_str}' for email {msg_id}, "
+                    f"using current time"
+                )
 
-            # Extract body
-            body, is_html = self._get_message_body(message)
+        date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
 
-            return {
-                "id": msg_id,
-                "subject": subject,
-                "sender": sender,
-                "date": date,
-                "body": body,
-                "is_html": is_html,
-                "labels": message["labelIds"],
-            }
+        # Extract body
+        body, is_html = self._get_message_body(message)
 
-        except HttpError as error:
-            status_code = error.resp.status
-            logger.error(
-                f"Error retrieving email {msg_id}: HTTP {status_code} - {error}"
-            )
-            return None
+        return {
+            "id": msg_id,
+            "subject": subject,
+            "sender": sender,
+            "date": date,
+            "body": body,
+            "is_html": is_html,
+            "labels": message["labelIds"],
+        }
 
     def _get_message_body(self, message: Dict[str, Any]) -> Tuple[str, bool]:
         """Extract the message body from the email.
@@ -309,6 +486,84 @@ class GmailClient:
 
         return ""
 
+    def ensure_label(self, label_name: str) -> Optional[str]:
+        """Get the ID of a label, creating the label if it doesn't exist.
+
+        Args:
+            label_name: Name of the label
+
+        Returns:
+            Label ID, or None if the label could not be resolved
+        """
+        if label_name in self._label_ids:
+            return self._label_ids[label_name]
+
+        try:
+            results = self._execute_with_retry(
+                lambda: self.service.users()
+                .labels()
+                .list(userId=self.user_id)
+                .execute()
+            )
+
+            for label in results.get("labels", []):
+                if label.get("name") == label_name:
+                    label_id = str(label["id"])
+                    self._label_ids[label_name] = label_id
+                    return label_id
+
+            logger.debug(f"Creating label: {label_name}")
+            created = self._execute_with_retry(
+                lambda: self.service.users()
+                .labels()
+                .create(
+                    userId=self.user_id,
+                    body={
+                        "name": label_name,
+                        "labelListVisibility": "labelHide",
+                        "messageListVisibility": "hide",
+                    },
+                )
+                .execute()
+            )
+            created_id = str(created["id"])
+            self._label_ids[label_name] = created_id
+            return created_id
+        except HttpError as error:
+            status_code = error.resp.status
+            logger.error(
+                f"Error ensuring label {label_name}: HTTP {status_code} - {error}"
+            )
+            return None
+
+    def add_label(self, msg_id: str, label_id: str) -> bool:
+        """Add a label to an email.
+
+        Args:
+            msg_id: Gmail message ID
+            label_id: Gmail label ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self._execute_with_retry(
+                lambda: self.service.users()
+                .messages()
+                .modify(
+                    userId=self.user_id, id=msg_id, body={"addLabelIds": [label_id]}
+                )
+                .execute()
+            )
+            logger.debug(f"Added label {label_id} to email {msg_id}")
+            return True
+        except HttpError as error:
+            status_code = error.resp.status
+            logger.error(
+                f"Error adding label to email {msg_id}: HTTP {status_code} - {error}"
+            )
+            return False
+
     def mark_as_read(self, msg_id: str) -> bool:
         """Mark an email as read.
 
@@ -337,6 +592,52 @@ class GmailClient:
             )
             return False
 
+    def batch_mark_as_read(
+        self, msg_ids: List[str], add_label_ids: Optional[List[str]] = None
+    ) -> bool:
+        """Mark multiple emails as read in batched modify calls.
+
+        Uses messages.batchModify so a whole poll cycle's worth of
+        emails costs one round trip instead of one per email.
+
+        Args:
+            msg_ids: Gmail message IDs
+            add_label_ids: Label IDs to add alongside removing UNREAD
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not msg_ids:
+            return True
+
+        body: Dict[str, Any] = {"removeLabelIds": ["UNREAD"]}
+        if add_label_ids:
+            body["addLabelIds"] = add_label_ids
+
+        try:
+            # batchModify accepts up to 1000 IDs per request
+            for start in range(0, len(msg_ids), self.BATCH_MODIFY_SIZE):
+                chunk = msg_ids[start : start + self.BATCH_MODIFY_SIZE]
+
+                def _batch_modify(ids: List[str] = chunk) -> Any:
+                    return (
+                        self.service.users()
+                        .messages()
+                        .batchModify(userId=self.user_id, body=dict(body, ids=ids))
+                        .execute()
+                    )
+
+                self._execute_with_retry(_batch_modify)
+            logger.debug(f"Marked {len(msg_ids)} emails as read")
+            return True
+        except HttpError as error:
+            status_code = error.resp.status
+            logger.error(
+                f"Error marking {len(msg_ids)} emails as read: "
+                f"HTTP {status_code} - {error}"
+            )
+            return False
+
     def archive_message(self, msg_id: str) -> bool:
         """Archive an email by removing the INBOX label.
 
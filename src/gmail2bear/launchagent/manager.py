@@ -4,6 +4,7 @@ This module provides functionality to install, uninstall, and manage
 the macOS Launch Agent for Gmail to Bear.
 """
 
+import functools
 import logging
 import os
 import platform
@@ -19,6 +20,16 @@ LAUNCH_AGENT_PLIST = f"{LAUNCH_AGENT_NAME}.plist"
 LAUNCH_AGENTS_DIR = os.path.expanduser("~/Library/LaunchAgents")
 
 
+@functools.lru_cache(maxsize=None)
+def _normalize_path(path: str) -> str:
+    """Expand the user directory and make a path absolute, memoized.
+
+    Managers are constructed with the same handful of paths, so caching
+    skips the repeated getcwd/expanduser work.
+    """
+    return os.path.abspath(os.path.expanduser(path))
+
+
 class LaunchAgentManager:
     """Manager for Gmail to Bear Launch Agent."""
 
@@ -39,10 +50,10 @@ class LaunchAgentManager:
             state_path: Path to the state file
             poll_interval: Polling interval in seconds (default: 300)
         """
-        self.config_path = os.path.abspath(os.path.expanduser(config_path))
-        self.credentials_path = os.path.abspath(os.path.expanduser(credentials_path))
-        self.token_path = os.path.abspath(os.path.expanduser(token_path))
-        self.state_path = os.path.abspath(os.path.expanduser(state_path))
+        self.config_path = _normalize_path(config_path)
+        self.credentials_path = _normalize_path(credentials_path)
+        self.token_path = _normalize_path(token_path)
+        self.state_path = _normalize_path(state_path)
         self.poll_interval = poll_interval
         self.use_uv = self._check_uv_available()
 
@@ -3,13 +3,22 @@
 This module handles the main processing logic for Gmail to Bear integration.
 """
 
+import concurrent.futures
 import functools
+import html
 import logging
+import os
+import queue
 import random
+import re
+import selectors
 import signal
 import socket
+import string
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 import html2text
 from google.oauth2.credentials import Credentials
@@ -24,6 +33,58 @@ from gmail2bear.state import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Trivial single-paragraph HTML bodies that can skip the full html2text
+# state machine
+_TRIVIAL_HTML = re.compile(r"\s*<p>([^<]*)</p>\s*", re.S)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str) -> Callable[..., str]:
+    """Pre-parse a note template into a reusable render function.
+
+    str.format re-parses the template string on every call; parsing it
+    once and joining the segments skips that work on the per-email path.
+    Cached by template string so config reloads pick up new templates.
+
+    Args:
+        template: Template string with {field} placeholders
+
+    Returns:
+        Callable that renders the template from keyword arguments
+    """
+    formatter = string.Formatter()
+    # Plain {field} names render with a dict lookup; dotted or indexed
+    # names ({date.year}, {subject[0]}) go through get_field so the full
+    # str.format access syntax keeps working
+    segments = tuple(
+        (
+            literal,
+            field,
+            spec,
+            conversion,
+            field is not None and "." not in field and "[" not in field,
+        )
+        for literal, field, spec, conversion in formatter.parse(template)
+    )
+
+    def render(**values: Any) -> str:
+        parts = []
+        for literal, field, spec, conversion, simple in segments:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                if simple:
+                    value = values[field]
+                else:
+                    value, _ = formatter.get_field(field, (), values)
+                if conversion:
+                    value = formatter.convert_field(value, conversion)
+                parts.append(format(value, spec or ""))
+        return "".join(parts)
+
+    return render
+
+
 # Type variable for the return type of the decorated function
 T = TypeVar("T")
 # Type for exceptions that can be caught
@@ -51,8 +112,22 @@ def retry_on_failure(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Precompute the backoff schedule and function name once per
+        # decorated function instead of per retry
+        schedule = tuple(
+            initial_backoff * (backoff_factor**attempt)
+            for attempt in range(max_retries)
+        )
+        func_name = getattr(func, "__name__", str(func))
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Bind hot callables to locals; local access is cheaper than
+            # global/cell lookups on every retry tick
+            _sleep = time.sleep
+            _warning = logger.warning
+            _uniform = random.uniform
+
             last_exception: Optional[Exception] = None
             for attempt in range(max_retries + 1):
                 try:
@@ -62,43 +137,29 @@ def retry_on_failure(
 
                     # Don't retry if this was the last attempt
                     if attempt >= max_retries:
-                        logger.error(
-                            f"Failed after {max_retries} retries: {func.__name__}"
-                        )
+                        logger.error(f"Failed after {max_retries} retries: {func_name}")
                         break
 
-                    # Calculate backoff time with jitter
-                    backoff_time = initial_backoff * (backoff_factor**attempt)
-                    # Use secrets module for cryptographically secure random numbers
-                    try:
-                        import secrets
-
-                        jitter_amount = (
-                            backoff_time * jitter * (secrets.randbelow(200) / 100 - 1)
-                        )
-                    except ImportError:
-                        # Fall back to random if secrets not available
-                        # ruff: noqa: S311
-                        jitter_amount = backoff_time * jitter * random.uniform(-1, 1)
+                    # Apply jitter to the precomputed backoff time
+                    backoff_time = schedule[attempt]
+                    jitter_amount = backoff_time * jitter * _uniform(-1, 1)
                     sleep_time = backoff_time + jitter_amount
 
                     # Log retry attempt
-                    logger.warning(
-                        f"Retry {attempt + 1}/{max_retries} for {func.__name__} "
+                    _warning(
+                        f"Retry {attempt + 1}/{max_retries} for {func_name} "
                         f"after {sleep_time:.2f}s due to: {str(e)}"
                     )
 
                     # Sleep before retry
-                    time.sleep(max(0.1, sleep_time))
+                    _sleep(max(0.1, sleep_time))
 
             # Re-raise the last exception
             if last_exception:
                 raise last_exception
 
             # This should never happen, but needed for type checking
-            raise RuntimeError(
-                f"Unexpected error in retry_on_failure for {func.__name__}"
-            )
+            raise RuntimeError(f"Unexpected error in retry_on_failure for {func_name}")
 
         return wrapper
 
@@ -108,6 +169,49 @@ def retry_on_failure(
 class EmailProcessor:
     """Main processor for Gmail to Bear integration."""
 
+    # Label applied to processed emails so polls can exclude them
+    # server-side instead of filtering client-side
+    PROCESSED_LABEL = "GmailToBear/Processed"
+
+    # Fixed slots make the attributes the service loop touches on every
+    # iteration (running, paused, consecutive_errors, ...) fixed-offset
+    # fields instead of dict lookups; "__dict__" is kept so instances
+    # stay open to ad-hoc attributes (tests monkeypatch methods)
+    __slots__ = (
+        "config_path",
+        "credentials_path",
+        "state_path",
+        "token_path",
+        "config",
+        "state_manager",
+        "bear_client",
+        "notification_manager",
+        "_converter_pool",
+        "running",
+        "paused",
+        "credentials",
+        "gmail_client",
+        "network_available",
+        "last_network_check",
+        "network_check_interval",
+        "last_config_check",
+        "config_check_interval",
+        "consecutive_errors",
+        "max_consecutive_errors",
+        "error_backoff_time",
+        "last_error_time",
+        "network_failure_count",
+        "auth_failure_count",
+        "_email_executor",
+        "_monitor_timer",
+        "_pending_read_ids",
+        "_failed_ids",
+        "_processed_label_id",
+        "_signal_rfd",
+        "_signal_wfd",
+        "__dict__",
+    )
+
     def __init__(
         self,
         config_path: str,
@@ -134,24 +238,35 @@ class EmailProcessor:
         self.bear_client = BearClient()
         self.notification_manager = NotificationManager(config=self.config)
 
-        # Initialize HTML converter
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.body_width = 0  # No wrapping
-        self.html_converter.protect_links = True
-        self.html_converter.mark_code = True
-        self.html_converter.default_image_alt = "Image"
+        # Worker pool for processing independent emails concurrently
+        self._email_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="gmail2bear-email"
+        )
+
+        # Pool of configured HTML converters; HTML2Text instances hold
+        # per-call state, so each worker thread needs its own
+        self._converter_pool: queue.Queue[html2text.HTML2Text] = queue.Queue(maxsize=4)
 
         # Service state
         self.running = False
         self.paused = False
         self.credentials: Optional[Credentials] = None
         self.gmail_client: Optional[GmailClient] = None
+        self._processed_label_id: Optional[str] = None
+        # IDs queued by workers for the batched mark-as-read; list
+        # append is atomic under the GIL
+        self._pending_read_ids: List[str] = []
+        # IDs whose processing failed; the stored history ID may already
+        # be past them, so they are requeued explicitly on later polls
+        self._failed_ids: Set[str] = set()
         self.network_available = True
         self.last_network_check: float = 0.0
         self.network_check_interval: float = 60.0  # seconds
         self.last_config_check: float = 0.0
         self.config_check_interval: float = 30.0  # seconds
+        self._monitor_timer: Optional[threading.Timer] = None
+        self._signal_rfd: Optional[int] = None
+        self._signal_wfd: Optional[int] = None
 
         # Error tracking
         self.consecutive_errors = 0
@@ -193,6 +308,13 @@ class EmailProcessor:
 
             # Initialize Gmail client
             self.gmail_client = GmailClient(self.credentials)
+
+            # Ensure the processed label exists so polls can filter
+            # server-side; processed_ids remains as a safety net
+            self._processed_label_id = self.gmail_client.ensure_label(
+                self.PROCESSED_LABEL
+            )
+
             logger.info("Successfully authenticated with Gmail API")
             self.auth_failure_count = 0  # Reset failure counter on success
             return True
@@ -245,34 +367,76 @@ class EmailProcessor:
         processed_count = 0
 
         try:
+            # Monotonic deadline keeps the poll cadence steady: each
+            # cycle sleeps for the remainder of the interval instead of
+            # drifting by processing time
+            next_tick = time.monotonic()
+
             while True:
                 logger.info(f"Checking for emails from {sender_email}")
 
-                # Get processed email IDs
-                processed_ids = self.state_manager.get_processed_ids()
-
                 # Track emails processed in this check
                 emails_processed_this_check = 0
 
                 try:
-                    # Get emails from sender with retry mechanism
-                    emails = self._get_emails_with_retry(
-                        sender_email=sender_email,
-                        max_results=10,
-                        only_unread=True,
-                        processed_ids=processed_ids,
-                    )
+                    emails = self._fetch_new_emails(sender_email)
+
+                    # Filter here, once; workers assume every email they
+                    # receive is new
+                    emails = [
+                        email
+                        for email in emails
+                        if not self.state_manager.is_processed(email["id"])
+                    ]
 
                     if not emails:
                         logger.info("No new emails to process")
                     else:
-                        logger.info(f"Found {len(emails)} new emails to process")
-
-                        # Process each email
-                        for email in emails:
-                            if self._process_single_email(email):
-                                processed_count += 1
-                                emails_processed_this_check += 1
+                        # IDs handed to workers this cycle, so a failed
+                        # email can't be refetched into an endless loop
+                        seen_ids: Set[str] = set()
+
+                        while emails:
+                            logger.info(f"Found {len(emails)} new emails to process")
+                            seen_ids.update(email["id"] for email in emails)
+
+                            # Process emails concurrently; each email's
+                            # Bear note creation and Gmail label updates
+                            # are independent of the others
+                            futures = {
+                                self._email_executor.submit(
+                                    self._process_single_email, email
+                                ): email["id"]
+                                for email in emails
+                            }
+
+                            # Overlap the next fetch with the Bear writes
+                            # above; mail arriving mid-cycle is drained
+                            # now instead of waiting a full poll interval
+                            next_fetch = self._email_executor.submit(
+                                self._fetch_new_emails, sender_email
+                            )
+
+                            for future in concurrent.futures.as_completed(futures):
+                                if future.result():
+                                    processed_count += 1
+                                    emails_processed_this_check += 1
+                                    self._failed_ids.discard(futures[future])
+                                else:
+                                    # Remember the failure so later polls
+                                    # refetch it by ID; the history cursor
+                                    # may already be past this message
+                                    self._failed_ids.add(futures[future])
+
+                            # One batchModify for everything processed above
+                            self._flush_pending_read_ids()
+
+                            emails = [
+                                email
+                                for email in next_fetch.result()
+                                if email["id"] not in seen_ids
+                                and not self.state_manager.is_processed(email["id"])
+                            ]
 
                     # Reset consecutive errors on success
                     self.consecutive_errors = 0
@@ -286,19 +450,13 @@ class EmailProcessor:
                     logger.error(error_msg)
 
                     if self.consecutive_errors >= self.max_consecutive_errors:
-                        critical_msg = (
-                            f"Multiple consecutive errors ({self.consecutive_errors}). "
-                            f"Pausing email processing for "
-                            f"{self.error_backoff_time} seconds."
-                        )
-                        logger.critical(critical_msg)
-                        self.notification_manager.notify_error(critical_msg)
-                        self.last_error_time = time.time()
+                        self._enter_backoff()
 
                         # Sleep for backoff time
                         if once:
                             break
                         time.sleep(self.error_backoff_time)
+                        next_tick = time.monotonic()
                         continue
 
                 # Send notification if emails were processed IN THIS CHECK
@@ -311,8 +469,14 @@ class EmailProcessor:
                 if once:
                     break
 
-                logger.info(f"Waiting {poll_interval} seconds before next check")
-                time.sleep(poll_interval)
+                next_tick += poll_interval
+                slack = next_tick - time.monotonic()
+                if slack > 0:
+                    logger.info(f"Waiting {slack:.1f} seconds before next check")
+                    time.sleep(slack)
+                else:
+                    logger.warning(f"Poll cycle overran its interval by {-slack:.1f}s")
+                    next_tick = time.monotonic()
 
         except KeyboardInterrupt:
             logger.info("Process interrupted by user")
@@ -338,6 +502,112 @@ class EmailProcessor:
 
         return self.gmail_client.get_emails_from_sender(**kwargs)
 
+    def _fetch_new_emails(
+        self, sender_email: Union[str, List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Fetch new emails, incrementally when a history ID is known.
+
+        Uses the Gmail history API to retrieve only messages added since
+        the last poll, so per-poll cost scales with new mail rather than
+        mailbox size. Falls back to a full sender query on the first run
+        or when the stored history ID has expired.
+
+        Args:
+            sender_email: Email address(es) of the sender(s)
+
+        Returns:
+            List of email dictionaries
+        """
+        if not self.gmail_client:
+            raise ValueError("Gmail client not initialized")
+
+        history_id = self.state_manager.last_history_id
+        if history_id:
+            result = self.gmail_client.get_new_message_ids_since(history_id)
+            if result is not None:
+                msg_ids, latest_history_id = result
+                msg_ids = [
+                    msg_id
+                    for msg_id in msg_ids
+                    if not self.state_manager.is_processed(msg_id)
+                ]
+                # Requeue earlier failures: the history call only returns
+                # mail newer than the cursor, which has already advanced
+                # past anything that failed on a previous poll
+                retry_ids = [
+                    msg_id for msg_id in self._failed_ids if msg_id not in msg_ids
+                ]
+                emails = self.gmail_client.get_emails_by_ids(msg_ids + retry_ids)
+                self.state_manager.set_history_id(latest_history_id)
+                # Match the fallback query's only_unread=True: mail the
+                # user already read should not become a note
+                new_emails = [
+                    email
+                    for email in emails
+                    if "UNREAD" in email.get("labels", [])
+                    and self._matches_sender(email["sender"], sender_email)
+                ]
+                # Forget requeued failures that no longer match (e.g. the
+                # user read the mail); they would otherwise refetch forever
+                kept_ids = {email["id"] for email in new_emails}
+                self._failed_ids.difference_update(
+                    msg_id for msg_id in retry_ids if msg_id not in kept_ids
+                )
+                return new_emails
+
+        # First run or expired history ID: full sender query
+        extra_query = ""
+        if self._processed_label_id:
+            extra_query = f"-label:{self.PROCESSED_LABEL}"
+
+        page_size = 10
+        emails = self._get_emails_with_retry(
+            sender_email=sender_email,
+            max_results=page_size,
+            only_unread=True,
+            extra_query=extra_query,
+        )
+
+        # Seed the incremental path only once the full query has drained
+        # the unread backlog; a full page means older mail may remain,
+        # and a history cursor taken now would skip it forever
+        if len(emails) < page_size:
+            latest = self.gmail_client.get_latest_history_id()
+            if latest:
+                self.state_manager.set_history_id(latest)
+
+        return emails
+
+    def _flush_pending_read_ids(self) -> None:
+        """Mark all emails processed this check as read in one batch call.
+
+        Also applies the processed label so future full queries exclude
+        these messages server-side.
+        """
+        if not self._pending_read_ids or not self.gmail_client:
+            return
+
+        msg_ids, self._pending_read_ids = self._pending_read_ids, []
+        add_label_ids = [self._processed_label_id] if self._processed_label_id else None
+        self.gmail_client.batch_mark_as_read(msg_ids, add_label_ids=add_label_ids)
+
+    @staticmethod
+    def _matches_sender(
+        sender_header: str, sender_email: Union[str, List[str]]
+    ) -> bool:
+        """Check whether a From header matches the configured sender(s).
+
+        Args:
+            sender_header: Raw From header value
+            sender_email: Configured sender address(es)
+
+        Returns:
+            True if the header contains one of the configured addresses
+        """
+        senders = sender_email if isinstance(sender_email, list) else [sender_email]
+        sender_header = sender_header.lower()
+        return any(sender.lower() in sender_header for sender in senders)
+
     def run_service(self) -> None:
         """Run the processor as a continuous service."""
         logger.info("Starting Gmail to Bear service")
@@ -351,15 +621,17 @@ class EmailProcessor:
 
         # Main service loop
         self.running = True
-        while self.running:
-            try:
-                # Check for configuration changes
-                self._check_config()
 
-                # Check network status if enabled
-                if self.config.should_monitor_network():
-                    self._check_network()
+        # Run one immediate check, then hand periodic config/network
+        # monitoring to a timer thread so the main loop stays free of
+        # per-iteration bookkeeping
+        self._check_config()
+        if self.config.should_monitor_network():
+            self._check_network()
+        self._schedule_monitor_tick()
 
+        while self.running:
+            try:
                 # Skip processing if paused
                 if self.paused:
                     logger.debug("Service is paused, skipping processing")
@@ -373,13 +645,8 @@ class EmailProcessor:
                     continue
 
                 # Skip processing if in error backoff period
-                if (
-                    (time.time() - self.last_error_time) < self.error_backoff_time
-                    and self.consecutive_errors >= self.max_consecutive_errors
-                ):
-                    remaining = int(
-                        self.error_backoff_time - (time.time() - self.last_error_time)
-                    )
+                remaining = self._in_backoff()
+                if remaining:
                     logger.debug(f"In error backoff period, {remaining}s remaining")
                     self._interruptible_sleep(min(remaining, 5))
                     continue
@@ -401,14 +668,7 @@ class EmailProcessor:
 
                     # If too many consecutive errors, enter backoff period
                     if self.consecutive_errors >= self.max_consecutive_errors:
-                        critical_msg = (
-                            f"Multiple consecutive errors ({self.consecutive_errors}). "
-                            f"Entering error backoff period for "
-                            f"{self.error_backoff_time} seconds."
-                        )
-                        logger.critical(critical_msg)
-                        self.notification_manager.notify_error(critical_msg)
-                        self.last_error_time = time.time()
+                        self._enter_backoff()
                         self._interruptible_sleep(min(self.error_backoff_time, 30))
                         continue
 
@@ -426,6 +686,13 @@ class EmailProcessor:
                 self._interruptible_sleep(30)
 
         # Clean up
+        if self._monitor_timer is not None:
+            self._monitor_timer.cancel()
+            self._monitor_timer = None
+        self._email_executor.shutdown(wait=True)
+        self._teardown_signal_wakeup()
+        if self.gmail_client:
+            self.gmail_client.close()
         logger.info("Gmail to Bear service stopped")
         self.notification_manager.notify_service_status("Service stopped")
 
@@ -448,6 +715,37 @@ class EmailProcessor:
         if hasattr(signal, "SIGINFO"):  # macOS
             signal.signal(signal.SIGINFO, self._handle_info_signal)
 
+        # Wake-up pipe: signal delivery writes a byte here so the
+        # selector-based sleep wakes immediately instead of waiting for
+        # the next one-second tick
+        if self._signal_rfd is None:
+            rfd, wfd = os.pipe()
+            os.set_blocking(rfd, False)
+            os.set_blocking(wfd, False)
+            try:
+                signal.set_wakeup_fd(wfd)
+            except ValueError:
+                # Not running in the main thread; fall back to
+                # increment-based sleeping
+                os.close(rfd)
+                os.close(wfd)
+            else:
+                self._signal_rfd = rfd
+                self._signal_wfd = wfd
+
+    def _teardown_signal_wakeup(self) -> None:
+        """Restore the signal wake-up fd and close the pipe."""
+        if self._signal_rfd is None or self._signal_wfd is None:
+            return
+        try:
+            signal.set_wakeup_fd(-1)
+        except ValueError:
+            pass
+        os.close(self._signal_rfd)
+        os.close(self._signal_wfd)
+        self._signal_rfd = None
+        self._signal_wfd = None
+
     def _handle_shutdown_signal(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals.
 
@@ -524,15 +822,78 @@ class EmailProcessor:
     def _interruptible_sleep(self, seconds: int) -> None:
         """Sleep for the specified time, but allow interruption.
 
+        When the signal wake-up pipe is set up, waits on it with a
+        selector so a delivered signal ends the sleep immediately;
+        otherwise falls back to sleeping in small increments.
+
         Args:
             seconds: Number of seconds to sleep
         """
-        # Sleep in small increments to allow for interruption
-        increment = 1
-        for _ in range(0, seconds, increment):
-            if not self.running:
-                break
-            time.sleep(increment)
+        if self._signal_rfd is None:
+            # Sleep in small increments to allow for interruption
+            increment = 1
+            for _ in range(0, seconds, increment):
+                if not self.running:
+                    break
+                time.sleep(increment)
+            return
+
+        deadline = time.monotonic() + seconds
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._signal_rfd, selectors.EVENT_READ)
+            while self.running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if selector.select(timeout=remaining):
+                    # Drain the bytes written by signal delivery and let
+                    # the main loop re-evaluate its state right away
+                    try:
+                        os.read(self._signal_rfd, 64)
+                    except OSError:
+                        pass
+                    break
+
+    def _enter_backoff(self) -> None:
+        """Record the start of the error-backoff period and notify."""
+        critical_msg = (
+            f"Multiple consecutive errors ({self.consecutive_errors}). "
+            f"Pausing email processing for {self.error_backoff_time} seconds."
+        )
+        logger.critical(critical_msg)
+        self.notification_manager.notify_error(critical_msg)
+        self.last_error_time = time.time()
+
+    def _in_backoff(self) -> int:
+        """Get the remaining error-backoff time.
+
+        Returns:
+            Remaining backoff time in seconds, or 0 when not in backoff
+        """
+        if self.consecutive_errors < self.max_consecutive_errors:
+            return 0
+        remaining = self.error_backoff_time - (time.time() - self.last_error_time)
+        return int(remaining) if remaining > 0 else 0
+
+    def _schedule_monitor_tick(self) -> None:
+        """Schedule the next periodic config/network check."""
+        self._monitor_timer = threading.Timer(
+            self.config_check_interval, self._monitor_tick
+        )
+        self._monitor_timer.daemon = True
+        self._monitor_timer.start()
+
+    def _monitor_tick(self) -> None:
+        """Run periodic config/network checks on the timer thread."""
+        try:
+            self._check_config()
+            if self.config.should_monitor_network():
+                self._check_network()
+        except Exception as e:
+            logger.error(f"Error in periodic monitoring check: {e}")
+        finally:
+            if self.running:
+                self._schedule_monitor_tick()
 
     def _check_config(self) -> None:
         """Check for configuration changes and reload if necessary."""
@@ -623,10 +984,10 @@ class EmailProcessor:
         """
         email_id = email["id"]
 
-        # Skip if already processed
-        if self.state_manager.is_processed(email_id):
-            logger.debug(f"Email {email_id} already processed, skipping")
-            return False
+        # Bind hot attributes to locals once; this runs per email on
+        # the worker pool
+        config = self.config
+        gmail_client = self.gmail_client
 
         try:
             # Convert HTML to Markdown if needed
@@ -634,12 +995,15 @@ class EmailProcessor:
                 logger.debug(f"Converting HTML to Markdown for email {email_id}")
                 email["body"] = self._convert_html_to_markdown(email["body"])
 
+            # Parse the date once per email; both templates use it
+            email["date"] = self._parse_email_date(email["date"])
+
             # Format note title and body using templates
             note_title = self._format_note_title(email)
             note_body = self._format_note_body(email)
 
             # Get tags from config
-            tags = self.config.get_tags()
+            tags = config.get_tags()
 
             # Create note in Bear
             logger.info(f"Creating Bear note for email: {email['subject']}")
@@ -647,14 +1011,15 @@ class EmailProcessor:
                 title=note_title, body=note_body, tags=tags, id_suffix=email_id
             )
 
-            if success and self.gmail_client:
-                # Mark email as read in Gmail
-                self.gmail_client.mark_as_read(email_id)
+            if success and gmail_client:
+                # Queue for the batched mark-as-read at the end of the
+                # poll cycle instead of one modify call per email
+                self._pending_read_ids.append(email_id)
 
                 # Archive email if configured
-                if self.config.should_archive_emails():
+                if config.should_archive_emails():
                     logger.debug(f"Archiving email {email_id}")
-                    self.gmail_client.archive_message(email_id)
+                    gmail_client.archive_message(email_id)
 
                 # Mark as processed in state manager
                 self.state_manager.mark_as_processed(email_id)
@@ -673,6 +1038,20 @@ class EmailProcessor:
             self.notification_manager.notify_error(error_msg)
             return False
 
+    def _new_html_converter(self) -> html2text.HTML2Text:
+        """Create a configured HTML-to-Markdown converter.
+
+        Returns:
+            Configured HTML2Text instance
+        """
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.body_width = 0  # No wrapping
+        converter.protect_links = True
+        converter.mark_code = True
+        converter.default_image_alt = "Image"
+        return converter
+
     def _convert_html_to_markdown(self, html_content: str) -> str:
         """Convert HTML content to Markdown.
 
@@ -683,39 +1062,66 @@ class EmailProcessor:
             Markdown formatted content
         """
         try:
-            return str(self.html_converter.handle(html_content))
+            # Fast path: a short single-paragraph body needs no parser
+            if len(html_content) < 256:
+                match = _TRIVIAL_HTML.fullmatch(html_content)
+                if match:
+                    # unescape so entities decode exactly as html2text
+                    # would ("&amp;" -> "&")
+                    return html.unescape(match.group(1).strip())
+
+            try:
+                converter = self._converter_pool.get_nowait()
+            except queue.Empty:
+                converter = self._new_html_converter()
+
+            try:
+                return str(converter.handle(html_content))
+            finally:
+                try:
+                    self._converter_pool.put_nowait(converter)
+                except queue.Full:
+                    pass
         except Exception as e:
             logger.error(f"Error converting HTML to Markdown: {e}")
             error_msg = f"Error converting HTML content: {str(e)}\n\n"
             return f"{error_msg}Original content:\n{html_content}"
 
-    def _format_note_title(self, email: Dict[str, Any]) -> str:
-        """Format the note title using the template from config.
+    def _parse_email_date(
+        self, date_value: Union[str, datetime]
+    ) -> Union[str, datetime]:
+        """Parse an email date string to a datetime object.
 
         Args:
-            email: Email data dictionary
+            date_value: Date string ("YYYY-MM-DD HH:MM:SS") or datetime object
 
         Returns:
-            Formatted note title
+            Parsed datetime, or the original value if parsing fails
         """
-        template = self.config.get_note_title_template()
-
-        # Parse date string to datetime object if it's a string
-        date_value = email["date"]
         if isinstance(date_value, str):
             try:
-                # Try to parse the date string to a datetime object
-                from datetime import datetime
-
-                date_value = datetime.strptime(date_value, "%Y-%m-%d %H:%M:%S")
+                # fromisoformat is a C fast path compared to strptime
+                return datetime.fromisoformat(date_value)
             except ValueError:
                 # If parsing fails, keep the original string
                 logger.warning(f"Could not parse date string: {date_value}")
+        return date_value
 
-        # Simple string formatting
-        return template.format(
+    def _format_note_title(self, email: Dict[str, Any]) -> str:
+        """Format the note title using the template from config.
+
+        Args:
+            email: Email data dictionary
+
+        Returns:
+            Formatted note title
+        """
+        template = self.config.get_note_title_template()
+
+        # Render with the pre-parsed template
+        return _compile_template(template)(
             subject=email["subject"],
-            date=date_value,
+            date=self._parse_email_date(email["date"]),
             sender=email["sender"],
             id=email["id"],
         )
@@ -731,23 +1137,11 @@ class EmailProcessor:
         """
         template = self.config.get_note_body_template()
 
-        # Parse date string to datetime object if it's a string
-        date_value = email["date"]
-        if isinstance(date_value, str):
-            try:
-                # Try to parse the date string to a datetime object
-                from datetime import datetime
-
-                date_value = datetime.strptime(date_value, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                # If parsing fails, keep the original string
-                logger.warning(f"Could not parse date string: {date_value}")
-
-        # Simple string formatting
-        return template.format(
+        # Render with the pre-parsed template
+        return _compile_template(template)(
             subject=email["subject"],
             body=email["body"],
-            date=date_value,
+            date=self._parse_email_date(email["date"]),
             sender=email["sender"],
             id=email["id"],
         )
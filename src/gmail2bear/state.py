@@ -3,16 +3,44 @@
 This module handles tracking of processed emails to prevent duplicates.
 """
 
+import atexit
 import json
 import logging
 import os
-from typing import List, Set
+import threading
+from typing import Any, List, Optional, Set, TextIO
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # Optional dependency (phase2 extra); stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from pybloom_live import ScalableBloomFilter  # type: ignore
+except ImportError:
+    # Optional dependency (phase2 extra); the set alone is authoritative
+    ScalableBloomFilter = None
 
 logger = logging.getLogger(__name__)
 
 
 class StateManager:
-    """Manages the state of processed emails."""
+    """Manages the state of processed emails.
+
+    Processed IDs are kept in a JSON snapshot plus an append-only log
+    sidecar. Marking an email as processed appends one line to the log
+    instead of rewriting the whole snapshot, so per-email I/O stays
+    constant as the state grows. The log is folded back into the
+    snapshot (compacted) on startup, on shutdown, and whenever it grows
+    past a multiple of the snapshot size.
+    """
+
+    # Compact once the log holds this many times more IDs than the snapshot
+    COMPACT_RATIO = 2
+
+    # Don't bother compacting before the log has at least this many entries
+    COMPACT_MIN_ENTRIES = 100
 
     def __init__(self, state_file_path: str):
         """Initialize the state manager.
@@ -21,11 +49,26 @@ class StateManager:
             state_file_path: Path to the state file
         """
         self.state_file_path = state_file_path
+        self.log_file_path = state_file_path + ".log"
         self.processed_ids: Set[str] = set()
+        self.last_history_id: Optional[str] = None
+        # Guards state mutations when emails are processed concurrently
+        self._lock = threading.Lock()
+        self._log_fh: Optional[TextIO] = None
+        self._log_entries = 0
+        self._snapshot_size = 0
+        self._bloom: Optional[Any] = None
         self._load_state()
+        if ScalableBloomFilter is not None:
+            # Bloom filter gives a definite-no fast path for is_processed;
+            # rebuilding from the loaded set is a cheap linear pass
+            self._bloom = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-6)
+            for email_id in self.processed_ids:
+                self._bloom.add(email_id)
+        atexit.register(self.compact)
 
     def _load_state(self) -> None:
-        """Load the state from the state file."""
+        """Load the state from the snapshot and append-only log."""
         if not os.path.exists(self.state_file_path):
             logger.debug(
                 f"State file not found at {self.state_file_path}, creating new state"
@@ -36,31 +79,119 @@ class StateManager:
             return
 
         try:
-            with open(self.state_file_path) as f:
-                state_data = json.load(f)
+            with open(self.state_file_path, "rb") as f:
+                if orjson is not None:
+                    state_data = orjson.loads(f.read())
+                else:
+                    state_data = json.load(f)
                 self.processed_ids = set(state_data.get("processed_ids", []))
+                self.last_history_id = state_data.get("history_id")
                 logger.debug(
                     f"Loaded {len(self.processed_ids)} processed email IDs from state"
                 )
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, ValueError) as e:
             logger.error(f"Error loading state file: {e}")
             # Create a new state file if the existing one is corrupted
             self._save_state()
 
-    def _save_state(self) -> None:
-        """Save the state to the state file."""
-        try:
-            state_data = {"processed_ids": list(self.processed_ids)}
+        self._snapshot_size = len(self.processed_ids)
+
+        # Replay any IDs appended since the last compaction
+        if os.path.exists(self.log_file_path):
+            try:
+                # One read + splitlines beats per-line iteration; the
+                # log is plain newline-delimited message IDs
+                with open(self.log_file_path) as f:
+                    log_ids = [line for line in f.read().splitlines() if line]
+                if log_ids:
+                    self.processed_ids.update(log_ids)
+                    logger.debug(
+                        f"Replayed {len(log_ids)} processed email IDs from log"
+                    )
+                    # Fold the log into a fresh snapshot on startup
+                    self._compact()
+            except OSError as e:
+                logger.error(f"Error reading state log file: {e}")
+
+    def _write_snapshot(self, path: str) -> None:
+        """Serialize the state snapshot to a file.
 
-            with open(self.state_file_path, "w") as f:
+        Uses orjson's C encoder when available, falling back to stdlib
+        json; both produce the same indented document.
+
+        Args:
+            path: File path to write the snapshot to
+        """
+        state_data = {
+            "processed_ids": list(self.processed_ids),
+            "history_id": self.last_history_id,
+        }
+
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(state_data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(path, "w") as f:
                 json.dump(state_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
 
+    def _save_state(self) -> None:
+        """Save the state snapshot to the state file.
+
+        Writes to a temp file and renames it into place so a crash
+        mid-write can never leave a truncated snapshot behind.
+        """
+        try:
+            tmp_path = self.state_file_path + ".tmp"
+            self._write_snapshot(tmp_path)
+            os.replace(tmp_path, self.state_file_path)
             logger.debug(
                 f"Saved {len(self.processed_ids)} processed email IDs to state file"
             )
         except OSError as e:
             logger.error(f"Error saving state file: {e}")
 
+    def _open_log(self) -> Optional[TextIO]:
+        """Open the append-only log, reusing the cached handle."""
+        if self._log_fh is None or self._log_fh.closed:
+            try:
+                # Line buffered so each ID hits disk without an fsync
+                self._log_fh = open(self.log_file_path, "a", buffering=1)
+            except OSError as e:
+                logger.error(f"Error opening state log file: {e}")
+                return None
+        return self._log_fh
+
+    def _compact(self) -> None:
+        """Rewrite the snapshot and truncate the log (caller holds the lock)."""
+        try:
+            tmp_path = self.state_file_path + ".tmp"
+            self._write_snapshot(tmp_path)
+            os.replace(tmp_path, self.state_file_path)
+
+            if self._log_fh is not None and not self._log_fh.closed:
+                self._log_fh.close()
+            self._log_fh = None
+            if os.path.exists(self.log_file_path):
+                os.remove(self.log_file_path)
+
+            self._log_entries = 0
+            self._snapshot_size = len(self.processed_ids)
+            logger.debug(
+                f"Compacted state to {self._snapshot_size} processed email IDs"
+            )
+        except OSError as e:
+            logger.error(f"Error compacting state file: {e}")
+
+    def compact(self) -> None:
+        """Fold the append-only log into the JSON snapshot."""
+        with self._lock:
+            if self._log_entries > 0:
+                self._compact()
+
     def is_processed(self, email_id: str) -> bool:
         """Check if an email has already been processed.
 
@@ -70,6 +201,9 @@ class StateManager:
         Returns:
             True if the email has been processed, False otherwise
         """
+        if self._bloom is not None and email_id not in self._bloom:
+            # Bloom filters have no false negatives, so this is definite
+            return False
         return email_id in self.processed_ids
 
     def mark_as_processed(self, email_id: str) -> None:
@@ -78,18 +212,61 @@ class StateManager:
         Args:
             email_id: Gmail message ID
         """
-        self.processed_ids.add(email_id)
-        self._save_state()
+        with self._lock:
+            if email_id in self.processed_ids:
+                return
+            self.processed_ids.add(email_id)
+            if self._bloom is not None:
+                self._bloom.add(email_id)
+
+            log_fh = self._open_log()
+            if log_fh is None:
+                # Fall back to a full snapshot if the log can't be opened
+                self._save_state()
+                return
+
+            try:
+                log_fh.write(email_id + "\n")
+                self._log_entries += 1
+            except OSError as e:
+                logger.error(f"Error writing to state log file: {e}")
+                self._save_state()
+                return
+
+            if self._log_entries >= max(
+                self.COMPACT_MIN_ENTRIES,
+                self.COMPACT_RATIO * self._snapshot_size,
+            ):
+                self._compact()
+
+    def set_history_id(self, history_id: str) -> None:
+        """Record the latest Gmail history ID for incremental sync.
+
+        The value is persisted with the next snapshot compaction rather
+        than written immediately; losing it on a crash only means one
+        full (rather than incremental) fetch on the next run.
+
+        Args:
+            history_id: Gmail mailbox history ID
+        """
+        with self._lock:
+            self.last_history_id = str(history_id)
 
     def get_processed_ids(self) -> List[str]:
         """Get the list of processed email IDs.
 
+        This copies the whole set; hot paths should call is_processed
+        (an O(1) set lookup) instead of iterating this list.
+
         Returns:
             List of processed email IDs
         """
-        return list(self.processed_ids)
+        with self._lock:
+            return list(self.processed_ids)
 
     def clear_state(self) -> None:
         """Clear the state (for testing or resetting)."""
-        self.processed_ids.clear()
-        self._save_state()
+        with self._lock:
+            self.processed_ids.clear()
+            self.last_history_id = None
+            self._compact()
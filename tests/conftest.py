@@ -6,21 +6,19 @@ import sys
 
 import pytest
 
+# Computed once; pytest_ignore_collect runs for every collected path
+_IS_DARWIN = platform.system() == "Darwin"
+_MACOS_ONLY_FILES = ("test_bear.py", "test_processor.py")
+
 
 def pytest_ignore_collect(collection_path, config):
     """Skip macOS-specific test files on non-macOS platforms."""
-    # Print debug information
-    print(f"Platform: {platform.system()}")
-    print(f"Python version: {sys.version}")
-    print(f"Checking path: {collection_path}")
-
-    if platform.system() != "Darwin":
-        # Skip macOS-specific test files on non-macOS platforms
-        if "test_bear.py" in str(collection_path) or "test_processor.py" in str(
-            collection_path
-        ):
-            print(f"Skipping macOS-specific test file: {collection_path}")
-            return True
+    if _IS_DARWIN:
+        return False
+
+    if collection_path.name in _MACOS_ONLY_FILES:
+        print(f"Skipping macOS-specific test file: {collection_path}")
+        return True
     return False
 
 
@@ -36,7 +34,7 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Skip macOS-specific tests on non-macOS platforms."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         skip_macos = pytest.mark.skip(reason="Test requires macOS")
         for item in items:
             if "test_bear" in item.nodeid or "test_processor" in item.nodeid:
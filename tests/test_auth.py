@@ -1,8 +1,11 @@
 """Tests for the auth module."""
 
+import contextlib
+import functools
 import json
+import logging
 import os
-import pickle
+import types
 from unittest import mock
 
 import pytest
@@ -13,46 +16,63 @@ from gmail2bear.auth import (
     migrate_to_keychain,
 )
 
+# Keep these tests on one pytest-xdist worker: they share the
+# module-scoped token fixtures, so spreading them would duplicate setup
+pytestmark = pytest.mark.xdist_group("keychain")
 
-@pytest.fixture
-def mock_credentials_file(tmp_path):
-    """Create a mock credentials file."""
-    credentials_file = tmp_path / "credentials.json"
-    credentials_file.write_text('{"installed": {"client_id": "test"}}')
-    return str(credentials_file)
+# mock_open wires up a whole file-handle mock hierarchy; build each
+# variant once per module instead of per test. The read position resets
+# every time the mock is called, and the autouse fixture below resets
+# call history, so sharing between tests is safe.
+_EMPTY_MOCK_OPEN = mock.mock_open()
+_OPEN_MOCKS = [_EMPTY_MOCK_OPEN]
 
 
-@pytest.fixture
-def mock_token_file(tmp_path):
-    """Create a mock token file with valid credentials."""
-    token_file = tmp_path / "token.pickle"
+@functools.lru_cache(maxsize=None)
+def _mock_open_with(data):
+    """Return a module-cached mock_open preloaded with ``data``."""
+    open_mock = mock.mock_open(read_data=data)
+    _OPEN_MOCKS.append(open_mock)
+    return open_mock
 
-    # Create a simple dictionary to represent credentials
-    # This avoids the issue with pickling MagicMock objects
-    mock_creds_data = {
-        "token": "test_token",
-        "refresh_token": "test_refresh_token",
-        "token_uri": "https://oauth2.googleapis.com/token",
-        "client_id": "test_client_id",
-        "client_secret": "test_client_secret",
-        "scopes": SCOPES,
-        "valid": True,
-        "expired": False,
-    }
 
-    # Save the dictionary to the pickle file
-    with open(token_file, "wb") as f:
-        pickle.dump(mock_creds_data, f)
+@pytest.fixture(autouse=True)
+def _silence_auth_logger():
+    """Silence the auth logger without per-test mock.patch machinery."""
+    from gmail2bear.auth import logger
 
-    return str(token_file)
+    was_disabled = logger.disabled
+    logger.disabled = True
+    yield
+    logger.disabled = was_disabled
+
+
+@pytest.fixture(autouse=True)
+def _clear_credentials_cache():
+    """Reset per-test shared state: credentials cache and open mocks."""
+    yield
+    get_credentials.cache_clear()
+    for open_mock in _OPEN_MOCKS:
+        open_mock.reset_mock()
 
 
-@pytest.fixture
-def mock_expired_token_file(tmp_path):
-    """Create a mock token file with expired credentials."""
-    token_file = tmp_path / "expired_token.pickle"
+@pytest.fixture(scope="module")
+def mock_credentials_file(tmp_path_factory):
+    """Create a mock credentials file shared across the module.
 
-    # Create a simple dictionary to represent expired credentials
+    Read-only: tests patch open/os.path.exists rather than mutate it.
+    """
+    credentials_file = tmp_path_factory.mktemp("auth") / "credentials.json"
+    credentials_file.write_text('{"installed": {"client_id": "test"}}')
+    return str(credentials_file)
+
+
+@pytest.fixture(scope="module")
+def mock_token_file(tmp_path_factory):
+    """Create a mock token file with valid credentials (read-only, shared)."""
+    token_file = tmp_path_factory.mktemp("auth") / "token.json"
+
+    # Tokens are stored as the JSON that google-auth produces
     mock_creds_data = {
         "token": "test_token",
         "refresh_token": "test_refresh_token",
@@ -60,18 +80,16 @@ def mock_expired_token_file(tmp_path):
         "client_id": "test_client_id",
         "client_secret": "test_client_secret",
         "scopes": SCOPES,
-        "valid": False,
-        "expired": True,
+        "valid": True,
+        "expired": False,
     }
 
-    # Save the dictionary to the pickle file
-    with open(token_file, "wb") as f:
-        pickle.dump(mock_creds_data, f)
+    token_file.write_text(json.dumps(mock_creds_data))
 
     return str(token_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_token_data():
     """Create mock token data."""
     return {
@@ -80,86 +98,88 @@ def mock_token_data():
         "token_uri": "https://oauth2.googleapis.com/token",
         "client_id": "test_client_id",
         "client_secret": "test_client_secret",
-        "scopes": SCOPES,
+        # JSON round-trips scopes as a list, so the fixture stores one
+        "scopes": list(SCOPES),
     }
 
 
+@pytest.fixture(scope="module")
+def mock_token_json(mock_token_data):
+    """Serialize the mock token data once for the whole module."""
+    return json.dumps(mock_token_data)
+
+
 def test_get_credentials_missing_file():
     """Test that get_credentials raises FileNotFoundError for missing file."""
     with pytest.raises(FileNotFoundError):
         get_credentials("nonexistent_file.json")
 
 
-def test_get_credentials_existing_token():
+def test_get_credentials_existing_token(caplog, monkeypatch):
     """Test that get_credentials loads existing token."""
+    from gmail2bear.auth import logger
+
     # For this test, we'll mock everything instead of using the fixtures
-    with mock.patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = True
-
-        with mock.patch("builtins.open", mock.mock_open()):
-            with mock.patch("pickle.load") as mock_load:
-                # Create a mock credentials object with the right properties
-                mock_creds = mock.MagicMock()
-                mock_creds.valid = True
-                mock_creds.expired = False
-                mock_load.return_value = mock_creds
-
-                with mock.patch("gmail2bear.auth.logger") as mock_logger:
-                    with mock.patch("os.makedirs"):
-                        credentials = get_credentials(
-                            "fake_credentials.json", "fake_token.pickle"
-                        )
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    monkeypatch.setattr("builtins.open", _mock_open_with("{}"))
+    monkeypatch.setattr("os.makedirs", lambda *args, **kwargs: None)
+
+    mock_credentials = mock.MagicMock()
+    # Plain data stand-in: the code only reads attributes
+    mock_creds = types.SimpleNamespace(valid=True, expired=False)
+    mock_credentials.from_authorized_user_info.return_value = mock_creds
+    monkeypatch.setattr("gmail2bear.auth.Credentials", mock_credentials)
+
+    logger.disabled = False
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        credentials = get_credentials("fake_credentials.json", "fake_token.json")
 
     assert credentials is not None
     assert credentials.valid
-    mock_logger.debug.assert_called_with(mock.ANY)
+    assert any(record.levelno == logging.DEBUG for record in caplog.records)
 
 
-def test_get_credentials_force_refresh():
+def test_get_credentials_force_refresh(monkeypatch):
     """Test that get_credentials forces refresh when requested."""
-    with mock.patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = True
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    monkeypatch.setattr("builtins.open", _EMPTY_MOCK_OPEN)
+    monkeypatch.setattr("os.makedirs", lambda *args, **kwargs: None)
 
-        with mock.patch("gmail2bear.auth.InstalledAppFlow") as mock_flow:
-            mock_creds = mock.MagicMock()
-            flow_instance = mock_flow.from_client_secrets_file.return_value
-            flow_instance.run_local_server.return_value = mock_creds
-
-            with mock.patch("builtins.open", mock.mock_open()):
-                with mock.patch("pickle.dump"):
-                    with mock.patch("os.makedirs"):
-                        get_credentials(
-                            "fake_credentials.json",
-                            "fake_token.pickle",
-                            force_refresh=True,
-                        )
+    mock_flow = mock.MagicMock()
+    flow_instance = mock_flow.from_client_secrets_file.return_value
+    flow_instance.run_local_server.return_value = mock.MagicMock()
+    monkeypatch.setattr("gmail2bear.auth.InstalledAppFlow", mock_flow)
+
+    get_credentials("fake_credentials.json", "fake_token.json", force_refresh=True)
 
     mock_flow.from_client_secrets_file.assert_called_once_with(
         "fake_credentials.json", SCOPES
     )
 
 
-def test_get_credentials_expired_token():
+def test_get_credentials_expired_token(monkeypatch):
     """Test that get_credentials refreshes expired token."""
-    with mock.patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = True
-
-        with mock.patch("builtins.open", mock.mock_open()):
-            with mock.patch("pickle.load") as mock_load:
-                # Create a mock credentials object with expired properties
-                mock_creds = mock.MagicMock()
-                mock_creds.valid = False
-                mock_creds.expired = True
-                mock_creds.refresh_token = "refresh_token"
-                mock_load.return_value = mock_creds
-
-                with mock.patch("gmail2bear.auth.Request") as mock_request:
-                    with mock.patch("pickle.dump"):
-                        with mock.patch("gmail2bear.auth.logger"):
-                            with mock.patch("os.makedirs"):
-                                get_credentials(
-                                    "fake_credentials.json", "fake_token.pickle"
-                                )
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    monkeypatch.setattr("builtins.open", _mock_open_with("{}"))
+    monkeypatch.setattr("os.makedirs", lambda *args, **kwargs: None)
+
+    mock_credentials = mock.MagicMock()
+    # Expired credentials as plain data; refresh/to_json are the only
+    # methods the refresh path touches
+    mock_creds = types.SimpleNamespace(
+        valid=False,
+        expired=True,
+        refresh_token="refresh_token",
+        refresh=lambda request: None,
+        to_json=lambda: "{}",
+    )
+    mock_credentials.from_authorized_user_info.return_value = mock_creds
+    monkeypatch.setattr("gmail2bear.auth.Credentials", mock_credentials)
+
+    mock_request = mock.MagicMock()
+    monkeypatch.setattr("gmail2bear.auth.Request", mock_request)
+
+    get_credentials("fake_credentials.json", "fake_token.json")
 
     # Check that refresh was attempted
     assert mock_request.called
@@ -167,33 +187,33 @@ def test_get_credentials_expired_token():
 
 def test_get_credentials_refresh_error():
     """Test that get_credentials handles refresh errors."""
-    with mock.patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = True
-
-        with mock.patch("builtins.open", mock.mock_open()):
-            with mock.patch("pickle.load") as mock_load:
-                # Create a mock credentials object with expired properties
-                mock_creds = mock.MagicMock()
-                mock_creds.valid = False
-                mock_creds.expired = True
-                mock_creds.refresh_token = "refresh_token"
-                mock_load.return_value = mock_creds
-
-                with mock.patch("gmail2bear.auth.Request") as mock_request:
-                    # Make refresh raise an exception
-                    mock_request.side_effect = Exception("Refresh error")
-
-                    with mock.patch("gmail2bear.auth.InstalledAppFlow") as mock_flow:
-                        mock_new_creds = mock.MagicMock()
-                        flow_return = mock_flow.from_client_secrets_file.return_value
-                        flow_return.run_local_server.return_value = mock_new_creds
-
-                        with mock.patch("pickle.dump"):
-                            with mock.patch("gmail2bear.auth.logger"):
-                                with mock.patch("os.makedirs"):
-                                    get_credentials(
-                                        "fake_credentials.json", "fake_token.pickle"
-                                    )
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch("os.path.exists", return_value=True))
+        stack.enter_context(mock.patch("builtins.open", _mock_open_with("{}")))
+        stack.enter_context(mock.patch("os.makedirs"))
+        mock_credentials = stack.enter_context(
+            mock.patch("gmail2bear.auth.Credentials")
+        )
+        mock_request = stack.enter_context(mock.patch("gmail2bear.auth.Request"))
+        mock_flow = stack.enter_context(mock.patch("gmail2bear.auth.InstalledAppFlow"))
+
+        # Expired credentials as plain data; Request() raising is what
+        # aborts the refresh, so refresh itself never runs
+        mock_creds = types.SimpleNamespace(
+            valid=False,
+            expired=True,
+            refresh_token="refresh_token",
+            refresh=lambda request: None,
+        )
+        mock_credentials.from_authorized_user_info.return_value = mock_creds
+
+        # Make refresh raise an exception
+        mock_request.side_effect = Exception("Refresh error")
+
+        flow_return = mock_flow.from_client_secrets_file.return_value
+        flow_return.run_local_server.return_value = mock.MagicMock()
+
+        get_credentials("fake_credentials.json", "fake_token.json")
 
     # Check that flow was run after refresh failed
     mock_flow.from_client_secrets_file.assert_called_once_with(
@@ -215,11 +235,11 @@ def test_keychain_manager_init():
     assert manager.service_name == "Custom Service"
 
     # Test enabled status based on platform
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
         assert manager.enabled is True
 
-    with mock.patch("platform.system", return_value="Linux"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", False):
         manager = KeychainManager()
         assert manager.enabled is False
 
@@ -228,19 +248,16 @@ def test_keychain_manager_is_supported():
     """Test _is_supported method."""
     manager = KeychainManager()
 
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         assert manager._is_supported() is True
 
-    with mock.patch("platform.system", return_value="Linux"):
-        assert manager._is_supported() is False
-
-    with mock.patch("platform.system", return_value="Windows"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", False):
         assert manager._is_supported() is False
 
 
 def test_keychain_manager_store_token_unsupported():
     """Test store_token method on unsupported platform."""
-    with mock.patch("platform.system", return_value="Linux"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", False):
         manager = KeychainManager()
         result = manager.store_token("test_account", {"token": "test"})
         assert result is False
@@ -248,14 +265,14 @@ def test_keychain_manager_store_token_unsupported():
 
 def test_keychain_manager_store_token_success():
     """Test store_token method success case."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to simulate successful execution
         with mock.patch("subprocess.run") as mock_run:
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 0
-            mock_run.return_value = mock_process
+            mock_run.return_value = types.SimpleNamespace(
+                returncode=0, stderr="", stdout=""
+            )
 
             result = manager.store_token("test_account", {"token": "test"})
 
@@ -271,40 +288,37 @@ def test_keychain_manager_store_token_success():
 
 def test_keychain_manager_store_token_already_exists():
     """Test store_token method when item already exists."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # First call fails with "already exists" error
         with mock.patch("subprocess.run") as mock_run:
-            mock_process1 = mock.MagicMock()
-            mock_process1.returncode = 1
-            mock_process1.stderr = "already exists"
-
-            mock_process2 = mock.MagicMock()
-            mock_process2.returncode = 0
-
-            mock_process3 = mock.MagicMock()
-            mock_process3.returncode = 0
-
-            mock_run.side_effect = [mock_process1, mock_process2, mock_process3]
+            mock_run.side_effect = [
+                types.SimpleNamespace(returncode=1, stderr="already exists", stdout=""),
+                types.SimpleNamespace(returncode=0, stderr="", stdout=""),
+            ]
 
             result = manager.store_token("test_account", {"token": "test"})
 
             assert result is True
-            assert mock_run.call_count == 3  # Initial attempt, delete, retry
+            # Initial attempt, then one fused delete + re-add batch
+            assert mock_run.call_count == 2
+            batch_args, batch_kwargs = mock_run.call_args
+            assert batch_args[0] == ["security", "-i"]
+            assert "delete-generic-password" in batch_kwargs["input"]
+            assert "add-generic-password" in batch_kwargs["input"]
 
 
 def test_keychain_manager_store_token_error():
     """Test store_token method error case."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to simulate failed execution
         with mock.patch("subprocess.run") as mock_run:
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 1
-            mock_process.stderr = "some error"
-            mock_run.return_value = mock_process
+            mock_run.return_value = types.SimpleNamespace(
+                returncode=1, stderr="some error", stdout=""
+            )
 
             result = manager.store_token("test_account", {"token": "test"})
 
@@ -313,7 +327,7 @@ def test_keychain_manager_store_token_error():
 
 def test_keychain_manager_store_token_exception():
     """Test store_token method exception handling."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to raise an exception
@@ -325,7 +339,7 @@ def test_keychain_manager_store_token_exception():
 
 def test_keychain_manager_retrieve_token_unsupported():
     """Test retrieve_token method on unsupported platform."""
-    with mock.patch("platform.system", return_value="Linux"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", False):
         manager = KeychainManager()
         result = manager.retrieve_token("test_account")
         assert result is None
@@ -333,15 +347,14 @@ def test_keychain_manager_retrieve_token_unsupported():
 
 def test_keychain_manager_retrieve_token_success(mock_token_data):
     """Test retrieve_token method success case."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to simulate successful execution
         with mock.patch("subprocess.run") as mock_run:
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 0
-            mock_process.stdout = json.dumps(mock_token_data)
-            mock_run.return_value = mock_process
+            mock_run.return_value = types.SimpleNamespace(
+                returncode=0, stderr="", stdout=json.dumps(mock_token_data)
+            )
 
             result = manager.retrieve_token("test_account")
 
@@ -357,14 +370,14 @@ def test_keychain_manager_retrieve_token_success(mock_token_data):
 
 def test_keychain_manager_retrieve_token_not_found():
     """Test retrieve_token method when token not found."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to simulate token not found
         with mock.patch("subprocess.run") as mock_run:
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 1
-            mock_run.return_value = mock_process
+            mock_run.return_value = types.SimpleNamespace(
+                returncode=1, stderr="", stdout=""
+            )
 
             result = manager.retrieve_token("test_account")
 
@@ -373,7 +386,7 @@ def test_keychain_manager_retrieve_token_not_found():
 
 def test_keychain_manager_retrieve_token_exception():
     """Test retrieve_token method exception handling."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to raise an exception
@@ -385,7 +398,7 @@ def test_keychain_manager_retrieve_token_exception():
 
 def test_keychain_manager_delete_token_unsupported():
     """Test delete_token method on unsupported platform."""
-    with mock.patch("platform.system", return_value="Linux"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", False):
         manager = KeychainManager()
         result = manager.delete_token("test_account")
         assert result is False
@@ -393,14 +406,14 @@ def test_keychain_manager_delete_token_unsupported():
 
 def test_keychain_manager_delete_token_success():
     """Test delete_token method success case."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to simulate successful execution
         with mock.patch("subprocess.run") as mock_run:
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 0
-            mock_run.return_value = mock_process
+            mock_run.return_value = types.SimpleNamespace(
+                returncode=0, stderr="", stdout=""
+            )
 
             result = manager.delete_token("test_account")
 
@@ -416,14 +429,14 @@ def test_keychain_manager_delete_token_success():
 
 def test_keychain_manager_delete_token_not_found():
     """Test delete_token method when token not found."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to simulate token not found
         with mock.patch("subprocess.run") as mock_run:
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 1
-            mock_run.return_value = mock_process
+            mock_run.return_value = types.SimpleNamespace(
+                returncode=1, stderr="", stdout=""
+            )
 
             result = manager.delete_token("test_account")
 
@@ -432,7 +445,7 @@ def test_keychain_manager_delete_token_not_found():
 
 def test_keychain_manager_delete_token_exception():
     """Test delete_token method exception handling."""
-    with mock.patch("platform.system", return_value="Darwin"):
+    with mock.patch("gmail2bear.auth._IS_DARWIN", True):
         manager = KeychainManager()
 
         # Mock subprocess.run to raise an exception
@@ -452,77 +465,56 @@ def test_migrate_to_keychain_file_not_found():
         assert result is False
 
 
-def test_migrate_to_keychain_success(mock_token_file, mock_token_data):
+def test_migrate_to_keychain_success(mock_token_file, mock_token_json):
     """Test successful migration to keychain."""
-    with mock.patch("os.path.exists", return_value=True):
-        with mock.patch(
-            "builtins.open", mock.mock_open(read_data=pickle.dumps(mock_token_data))
-        ):
-            with mock.patch("gmail2bear.auth.Credentials") as mock_credentials:
-                mock_creds = mock.MagicMock()
-                mock_creds.to_json.return_value = json.dumps(mock_token_data)
-                mock_load = mock.MagicMock(return_value=mock_creds)
-
-                with mock.patch("pickle.load", mock_load):
-                    with mock.patch("platform.system", return_value="Darwin"):
-                        with mock.patch("subprocess.run") as mock_run:
-                            mock_process = mock.MagicMock()
-                            mock_process.returncode = 0
-                            mock_run.return_value = mock_process
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch("os.path.exists", return_value=True))
+        stack.enter_context(
+            mock.patch("builtins.open", _mock_open_with(mock_token_json))
+        )
+        stack.enter_context(mock.patch("gmail2bear.auth._IS_DARWIN", True))
+        mock_run = stack.enter_context(mock.patch("subprocess.run"))
+        mock_run.return_value = mock.MagicMock(returncode=0)
 
-                            result = migrate_to_keychain(mock_token_file)
+        result = migrate_to_keychain(mock_token_file)
 
-                            assert result is True
-                            mock_run.assert_called_once()
+    assert result is True
+    mock_run.assert_called_once()
 
 
-def test_migrate_to_keychain_with_delete(mock_token_file, mock_token_data):
+def test_migrate_to_keychain_with_delete(mock_token_file, mock_token_json):
     """Test migration to keychain with file deletion."""
-    with mock.patch("os.path.exists", return_value=True):
-        with mock.patch(
-            "builtins.open", mock.mock_open(read_data=pickle.dumps(mock_token_data))
-        ):
-            with mock.patch("gmail2bear.auth.Credentials") as mock_credentials:
-                mock_creds = mock.MagicMock()
-                mock_creds.to_json.return_value = json.dumps(mock_token_data)
-                mock_load = mock.MagicMock(return_value=mock_creds)
-
-                with mock.patch("pickle.load", mock_load):
-                    with mock.patch("platform.system", return_value="Darwin"):
-                        with mock.patch("subprocess.run") as mock_run:
-                            mock_process = mock.MagicMock()
-                            mock_process.returncode = 0
-                            mock_run.return_value = mock_process
-
-                            with mock.patch("os.remove") as mock_remove:
-                                result = migrate_to_keychain(
-                                    mock_token_file, delete_file=True
-                                )
-
-                                assert result is True
-                                mock_remove.assert_called_once_with(mock_token_file)
-
-
-def test_migrate_to_keychain_unsupported_platform(mock_token_file):
-    """Test migration to keychain on unsupported platform."""
-    with mock.patch("os.path.exists", return_value=True):
-        with mock.patch("builtins.open", mock.mock_open()):
-            with mock.patch("gmail2bear.auth.Credentials") as mock_credentials:
-                mock_creds = mock.MagicMock()
-                mock_load = mock.MagicMock(return_value=mock_creds)
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch("os.path.exists", return_value=True))
+        stack.enter_context(
+            mock.patch("builtins.open", _mock_open_with(mock_token_json))
+        )
+        stack.enter_context(mock.patch("gmail2bear.auth._IS_DARWIN", True))
+        mock_run = stack.enter_context(mock.patch("subprocess.run"))
+        mock_run.return_value = mock.MagicMock(returncode=0)
+        mock_remove = stack.enter_context(mock.patch("os.remove"))
 
-                with mock.patch("pickle.load", mock_load):
-                    with mock.patch("platform.system", return_value="Linux"):
-                        result = migrate_to_keychain(mock_token_file)
+        result = migrate_to_keychain(mock_token_file, delete_file=True)
 
-                        assert result is False
+    assert result is True
+    mock_remove.assert_called_once_with(mock_token_file)
+
+
+def test_migrate_to_keychain_unsupported_platform(
+    mock_token_file, mock_token_json, monkeypatch
+):
+    """Test migration to keychain on unsupported platform."""
+    monkeypatch.setattr("builtins.open", _mock_open_with(mock_token_json))
+    monkeypatch.setattr("gmail2bear.auth._IS_DARWIN", False)
+
+    assert migrate_to_keychain(mock_token_file) is False
 
 
 def test_migrate_to_keychain_exception(mock_token_file):
     """Test migration to keychain with exception."""
     with mock.patch("os.path.exists", return_value=True):
-        with mock.patch("builtins.open", mock.mock_open()):
-            with mock.patch("pickle.load", side_effect=Exception("Test error")):
+        with mock.patch("builtins.open", _EMPTY_MOCK_OPEN):
+            with mock.patch("json.load", side_effect=Exception("Test error")):
                 result = migrate_to_keychain(mock_token_file)
                 assert result is False
 
@@ -557,29 +549,34 @@ def test_get_credentials_keychain_fallback_to_file(
     mock_credentials_file, mock_token_file
 ):
     """Test get_credentials fallback to file when keychain retrieval fails."""
-    with mock.patch("platform.system", return_value="Darwin"):
-        with mock.patch("gmail2bear.auth.KeychainManager") as mock_keychain_manager:
-            # Configure the mock keychain manager to fail retrieval
-            mock_manager_instance = mock_keychain_manager.return_value
-            mock_manager_instance.enabled = True
-            mock_manager_instance.retrieve_token.return_value = None
-
-            with mock.patch("os.path.exists", return_value=True):
-                with mock.patch("builtins.open", mock.mock_open()):
-                    with mock.patch("pickle.load") as mock_load:
-                        mock_creds = mock.MagicMock()
-                        mock_creds.valid = True
-                        mock_load.return_value = mock_creds
-
-                        with mock.patch("gmail2bear.auth.logger"):
-                            credentials = get_credentials(
-                                mock_credentials_file,
-                                mock_token_file,
-                                use_keychain=True,
-                            )
-
-                            assert credentials is mock_creds
-                            mock_manager_instance.retrieve_token.assert_called_once()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch("gmail2bear.auth._IS_DARWIN", True))
+        stack.enter_context(mock.patch("os.path.exists", return_value=True))
+        stack.enter_context(mock.patch("builtins.open", _mock_open_with("{}")))
+        mock_keychain_manager = stack.enter_context(
+            mock.patch("gmail2bear.auth.KeychainManager")
+        )
+        mock_credentials = stack.enter_context(
+            mock.patch("gmail2bear.auth.Credentials")
+        )
+
+        # Configure the mock keychain manager to fail retrieval
+        mock_manager_instance = mock_keychain_manager.return_value
+        mock_manager_instance.enabled = True
+        mock_manager_instance.retrieve_token.return_value = None
+
+        mock_creds = mock.MagicMock()
+        mock_creds.valid = True
+        mock_credentials.from_authorized_user_info.return_value = mock_creds
+
+        credentials = get_credentials(
+            mock_credentials_file,
+            mock_token_file,
+            use_keychain=True,
+        )
+
+    assert credentials is mock_creds
+    mock_manager_instance.retrieve_token.assert_called_once()
 
 
 def test_get_credentials_save_to_keychain_after_oauth(mock_credentials_file):
@@ -598,28 +595,34 @@ def test_get_credentials_save_to_keychain_after_oauth(mock_credentials_file):
     # Create a temporary token path
     token_path = os.path.join(os.path.dirname(mock_credentials_file), "token.pickle")
 
-    with mock.patch(
-        "os.path.exists", side_effect=lambda path: path == mock_credentials_file
-    ):
-        with mock.patch(
-            "gmail2bear.auth.InstalledAppFlow.from_client_secrets_file",
-            return_value=mock_flow,
-        ):
-            with mock.patch(
-                "gmail2bear.auth.KeychainManager", return_value=mock_keychain
-            ):
-                with mock.patch("platform.system", return_value="Darwin"):
-                    with mock.patch("pickle.dump") as mock_dump:
-                        with mock.patch("os.makedirs"):
-                            with mock.patch("builtins.open", mock.mock_open()):
-                                # Call the function
-                                credentials = get_credentials(
-                                    credentials_path=mock_credentials_file,
-                                    token_path=token_path,
-                                    use_keychain=True,
-                                )
-
-                                # Verify result
-                                assert credentials is mock_creds
-                                mock_keychain.store_token.assert_called_once()
-                                mock_dump.assert_called_once()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch(
+                "os.path.exists", side_effect=lambda path: path == mock_credentials_file
+            )
+        )
+        stack.enter_context(
+            mock.patch(
+                "gmail2bear.auth.InstalledAppFlow.from_client_secrets_file",
+                return_value=mock_flow,
+            )
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.auth.KeychainManager", return_value=mock_keychain)
+        )
+        stack.enter_context(mock.patch("gmail2bear.auth._IS_DARWIN", True))
+        stack.enter_context(mock.patch("os.makedirs"))
+        mock_file = mock.mock_open()
+        stack.enter_context(mock.patch("builtins.open", mock_file))
+
+        # Call the function
+        credentials = get_credentials(
+            credentials_path=mock_credentials_file,
+            token_path=token_path,
+            use_keychain=True,
+        )
+
+    # Verify result
+    assert credentials is mock_creds
+    mock_keychain.store_token.assert_called_once()
+    mock_file().write.assert_called_once_with(mock_creds.to_json.return_value)
@@ -1,6 +1,9 @@
-"""Tests for the Bear module."""
+"""Tests for the Bear module.
+
+macOS-only: conftest.py excludes this file from collection on other
+platforms, so no per-test skip marker is needed here.
+"""
 
-import platform
 import urllib.parse
 from unittest import mock
 
@@ -8,10 +11,11 @@ import pytest
 
 from gmail2bear.bear import BearClient
 
-# Skip all tests in this module on non-macOS platforms
-pytestmark = pytest.mark.skipif(
-    platform.system() != "Darwin", reason="Bear tests only run on macOS"
-)
+
+@pytest.fixture(scope="module")
+def bear_client():
+    """Share one BearClient across the module; it is stateless."""
+    return BearClient()
 
 
 def test_bear_client_init():
@@ -20,13 +24,11 @@ def test_bear_client_init():
     assert client.base_url == "bear://x-callback-url"
 
 
-def test_build_url():
+def test_build_url(bear_client):
     """Test that _build_url correctly builds a Bear URL."""
-    client = BearClient()
-
     params = {"title": "Test Note", "text": "This is a test note", "tags": "test tag"}
 
-    url = client._build_url("create", params)
+    url = bear_client._build_url("create", params)
 
     assert url.startswith("bear://x-callback-url/create?")
     assert "title=Test%20Note" in url
@@ -34,15 +36,13 @@ def test_build_url():
     assert "tags=test%20tag" in url
 
 
-def test_create_note_success():
+def test_create_note_success(bear_client):
     """Test that create_note successfully creates a note."""
-    client = BearClient()
-
     with mock.patch("subprocess.run") as mock_run:
         # Mock successful subprocess run
         mock_run.return_value = mock.Mock(returncode=0)
 
-        result = client.create_note(
+        result = bear_client.create_note(
             title="Test Note",
             body="This is a test note",
             tags=["test", "note"],
@@ -58,53 +58,54 @@ def test_create_note_success():
     url = call_args[1]
 
     assert "bear://x-callback-url/create?" in url
-    assert "title=Test%20Note" in url
+
+    # Parse the query string in one pass rather than split/unquote chains
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+    assert query["title"][0] == "Test Note"
 
     # Check that tags were added to the body
-    decoded_text = urllib.parse.unquote(url.split("text=")[1].split("&")[0])
+    decoded_text = query["text"][0]
     assert "#test #note" in decoded_text
     assert "ID: 123" in decoded_text
 
 
-def test_create_note_no_tags():
+def test_create_note_no_tags(bear_client):
     """Test that create_note works without tags."""
-    client = BearClient()
-
     with mock.patch("subprocess.run") as mock_run:
         # Mock successful subprocess run
         mock_run.return_value = mock.Mock(returncode=0)
 
-        result = client.create_note(title="Test Note", body="This is a test note")
+        result = bear_client.create_note(title="Test Note", body="This is a test note")
 
     assert result is True
     mock_run.assert_called_once()
 
 
-def test_create_note_subprocess_error():
+def test_create_note_subprocess_error(bear_client):
     """Test that create_note handles subprocess errors."""
-    client = BearClient()
-
     with mock.patch("subprocess.run") as mock_run:
         # Mock subprocess error
         mock_run.side_effect = Exception("Subprocess error")
 
         with mock.patch("gmail2bear.bear.logger") as mock_logger:
-            result = client.create_note(title="Test Note", body="This is a test note")
+            result = bear_client.create_note(
+                title="Test Note", body="This is a test note"
+            )
 
     assert result is False
     mock_logger.error.assert_called_once_with(mock.ANY)
 
 
-def test_create_note_nonzero_return_code():
+def test_create_note_nonzero_return_code(bear_client):
     """Test that create_note handles non-zero return codes."""
-    client = BearClient()
-
     with mock.patch("subprocess.run") as mock_run:
         # Mock non-zero return code
         mock_run.return_value = mock.Mock(returncode=1, stderr="Error")
 
         with mock.patch("gmail2bear.bear.logger") as mock_logger:
-            result = client.create_note(title="Test Note", body="This is a test note")
+            result = bear_client.create_note(
+                title="Test Note", body="This is a test note"
+            )
 
     assert result is False
     mock_logger.error.assert_called_once_with(mock.ANY)
@@ -1,25 +1,35 @@
 """Tests for the CLI module."""
 
+import contextlib
+import types
 from unittest import mock
 
 import pytest
 from gmail2bear import cli
 
+# Default argv fields, built once at module scope; the fixture copies
+# them into a fresh namespace so tests can mutate without cross-talk
+_ARGS_DEFAULTS = {
+    "config": "config.ini",
+    "credentials": "credentials.json",
+    "state": "state.txt",
+    "token": "token.pickle",
+    "once": False,
+    "force_refresh": False,
+    "init_config": False,
+    "debug": False,
+    "command": "run",
+}
+
 
 @pytest.fixture
 def mock_args():
-    """Create mock command-line arguments."""
-    args = mock.MagicMock()
-    args.config = "config.ini"
-    args.credentials = "credentials.json"
-    args.state = "state.txt"
-    args.token = "token.pickle"
-    args.once = False
-    args.force_refresh = False
-    args.init_config = False
-    args.debug = False
-    args.command = "run"
-    return args
+    """Create mock command-line arguments.
+
+    Plain namespace rather than MagicMock: main() only reads fixed
+    attributes, and tests mutate fields for the scenario under test.
+    """
+    return types.SimpleNamespace(**_ARGS_DEFAULTS)
 
 
 def test_version():
@@ -45,12 +55,20 @@ def test_setup_logging():
             mock_config.get_logging_level.assert_called_once()
 
 
-def test_parse_args():
-    """Test that parse_args parses arguments correctly."""
-    with mock.patch("sys.argv", ["gmail2bear", "run", "--once"]):
+@pytest.mark.parametrize(
+    "argv, attr, expected",
+    [
+        (["gmail2bear", "run", "--once"], "once", True),
+        (["gmail2bear", "run", "--force-refresh"], "force_refresh", True),
+        (["gmail2bear", "run"], "command", "run"),
+        (["gmail2bear", "init-config"], "command", "init-config"),
+    ],
+)
+def test_parse_args(argv, attr, expected):
+    """Test that parse_args maps argv onto the expected attribute."""
+    with mock.patch("sys.argv", argv):
         args = cli.parse_args()
-        assert args.once is True
-        assert args.command == "run"
+        assert getattr(args, attr) == expected
 
 
 def test_parse_args_defaults():
@@ -66,146 +84,113 @@ def test_parse_args_defaults():
         assert "state.txt" in args.state
 
 
-def test_parse_args_init_config():
-    """Test the --init-config argument."""
-    with mock.patch("sys.argv", ["gmail2bear", "init-config"]):
-        args = cli.parse_args()
-        assert args.command == "init-config"
+def test_main_init_config_success(mock_args):
+    """Test main with --init-config (success)."""
+    mock_args.command = "init-config"
+    with contextlib.ExitStack() as stack:
+        mock_init_config = stack.enter_context(
+            mock.patch("gmail2bear.cli.init_config_command", return_value=0)
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.cli.parse_args", return_value=mock_args)
+        )
+        stack.enter_context(mock.patch("gmail2bear.cli.setup_logging"))
 
+        result = cli.main()
 
-def test_parse_args_force_refresh():
-    """Test the --force-refresh argument."""
-    with mock.patch("sys.argv", ["gmail2bear", "run", "--force-refresh"]):
-        args = cli.parse_args()
-        assert args.force_refresh is True
-        assert args.command == "run"
+    assert result == 0
+    mock_init_config.assert_called_once()
 
 
-def test_parse_args_once():
-    """Test the --once argument."""
-    with mock.patch("sys.argv", ["gmail2bear", "run", "--once"]):
-        args = cli.parse_args()
-        assert args.once is True
-        assert args.command == "run"
+def test_main_init_config_failure(mock_args):
+    """Test main with --init-config (failure)."""
+    mock_args.command = "init-config"
+    with contextlib.ExitStack() as stack:
+        mock_init_config = stack.enter_context(
+            mock.patch("gmail2bear.cli.init_config_command", return_value=1)
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.cli.parse_args", return_value=mock_args)
+        )
+        stack.enter_context(mock.patch("gmail2bear.cli.setup_logging"))
 
+        result = cli.main()
 
-def test_main_init_config_success():
-    """Test main with --init-config (success)."""
-    with mock.patch("gmail2bear.cli.init_config_command") as mock_init_config:
-        mock_init_config.return_value = 0
-        with mock.patch("gmail2bear.cli.parse_args") as mock_parse_args:
-            mock_parse_args.return_value = mock.MagicMock(
-                config="config.ini",
-                credentials="credentials.json",
-                state="state.txt",
-                token="token.pickle",
-                debug=False,
-                command="init-config",
-            )
-            with mock.patch("gmail2bear.cli.setup_logging"):
-                result = cli.main()
-        assert result == 0
-        mock_init_config.assert_called_once()
-
-
-def test_main_init_config_failure():
-    """Test main with --init-config (failure)."""
-    with mock.patch("gmail2bear.cli.init_config_command") as mock_init_config:
-        mock_init_config.return_value = 1
-        with mock.patch("gmail2bear.cli.parse_args") as mock_parse_args:
-            mock_parse_args.return_value = mock.MagicMock(
-                config="config.ini",
-                credentials="credentials.json",
-                state="state.txt",
-                token="token.pickle",
-                debug=False,
-                command="init-config",
-            )
-            with mock.patch("gmail2bear.cli.setup_logging"):
-                result = cli.main()
-        assert result == 1
-        mock_init_config.assert_called_once()
-
-
-def test_main_auth_failure():
+    assert result == 1
+    mock_init_config.assert_called_once()
+
+
+def test_main_auth_failure(mock_args):
     """Test main with authentication failure."""
-    with mock.patch("gmail2bear.cli.run_command") as mock_run_command:
-        mock_run_command.return_value = 1
-        with mock.patch("gmail2bear.cli.parse_args") as mock_parse_args:
-            mock_parse_args.return_value = mock.MagicMock(
-                force_refresh=False,
-                once=True,
-                config="config.ini",
-                credentials="credentials.json",
-                state="state.txt",
-                token="token.pickle",
-                debug=False,
-                command="run",
-            )
-            with mock.patch("gmail2bear.cli.setup_logging"):
-                result = cli.main()
-        assert result == 1
-        mock_run_command.assert_called_once()
-
-
-def test_main_process_success():
+    mock_args.command = "run"
+    mock_args.once = True
+    with contextlib.ExitStack() as stack:
+        mock_run_command = stack.enter_context(
+            mock.patch("gmail2bear.cli.run_command", return_value=1)
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.cli.parse_args", return_value=mock_args)
+        )
+        stack.enter_context(mock.patch("gmail2bear.cli.setup_logging"))
+
+        result = cli.main()
+
+    assert result == 1
+    mock_run_command.assert_called_once()
+
+
+def test_main_process_success(mock_args):
     """Test main with successful processing."""
-    with mock.patch("gmail2bear.cli.run_command") as mock_run_command:
-        mock_run_command.return_value = 0
-        with mock.patch("gmail2bear.cli.parse_args") as mock_parse_args:
-            mock_parse_args.return_value = mock.MagicMock(
-                force_refresh=False,
-                once=True,
-                config="config.ini",
-                credentials="credentials.json",
-                state="state.txt",
-                token="token.pickle",
-                debug=False,
-                command="run",
-            )
-            with mock.patch("gmail2bear.cli.setup_logging"):
-                result = cli.main()
-        assert result == 0
-        mock_run_command.assert_called_once()
-
-
-def test_main_process_exception():
+    mock_args.command = "run"
+    mock_args.once = True
+    with contextlib.ExitStack() as stack:
+        mock_run_command = stack.enter_context(
+            mock.patch("gmail2bear.cli.run_command", return_value=0)
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.cli.parse_args", return_value=mock_args)
+        )
+        stack.enter_context(mock.patch("gmail2bear.cli.setup_logging"))
+
+        result = cli.main()
+
+    assert result == 0
+    mock_run_command.assert_called_once()
+
+
+def test_main_process_exception(mock_args):
     """Test main with exception during processing."""
-    with mock.patch("gmail2bear.cli.run_command") as mock_run_command:
-        mock_run_command.return_value = 1
-        with mock.patch("gmail2bear.cli.parse_args") as mock_parse_args:
-            mock_parse_args.return_value = mock.MagicMock(
-                force_refresh=False,
-                once=True,
-                config="config.ini",
-                credentials="credentials.json",
-                state="state.txt",
-                token="token.pickle",
-                debug=False,
-                command="run",
-            )
-            with mock.patch("gmail2bear.cli.setup_logging"):
-                result = cli.main()
-        assert result == 1
-        mock_run_command.assert_called_once()
-
-
-def test_main_keyboard_interrupt():
+    mock_args.command = "run"
+    mock_args.once = True
+    with contextlib.ExitStack() as stack:
+        mock_run_command = stack.enter_context(
+            mock.patch("gmail2bear.cli.run_command", return_value=1)
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.cli.parse_args", return_value=mock_args)
+        )
+        stack.enter_context(mock.patch("gmail2bear.cli.setup_logging"))
+
+        result = cli.main()
+
+    assert result == 1
+    mock_run_command.assert_called_once()
+
+
+def test_main_keyboard_interrupt(mock_args):
     """Test main with keyboard interrupt during processing."""
-    with mock.patch("gmail2bear.cli.run_command") as mock_run_command:
-        mock_run_command.return_value = 0
-        with mock.patch("gmail2bear.cli.parse_args") as mock_parse_args:
-            mock_parse_args.return_value = mock.MagicMock(
-                force_refresh=False,
-                once=True,
-                config="config.ini",
-                credentials="credentials.json",
-                state="state.txt",
-                token="token.pickle",
-                debug=False,
-                command="run",
-            )
-            with mock.patch("gmail2bear.cli.setup_logging"):
-                result = cli.main()
-        assert result == 0
-        mock_run_command.assert_called_once()
+    mock_args.command = "run"
+    mock_args.once = True
+    with contextlib.ExitStack() as stack:
+        mock_run_command = stack.enter_context(
+            mock.patch("gmail2bear.cli.run_command", return_value=0)
+        )
+        stack.enter_context(
+            mock.patch("gmail2bear.cli.parse_args", return_value=mock_args)
+        )
+        stack.enter_context(mock.patch("gmail2bear.cli.setup_logging"))
+
+        result = cli.main()
+
+    assert result == 0
+    mock_run_command.assert_called_once()
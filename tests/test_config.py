@@ -6,12 +6,7 @@ from unittest import mock
 import pytest
 from gmail2bear.config import Config
 
-
-@pytest.fixture
-def sample_config_file(tmp_path):
-    """Create a sample configuration file."""
-    config_file = tmp_path / "config.ini"
-    config_content = """[gmail]
+SAMPLE_INI = """[gmail]
 sender_email = test@example.com
 poll_interval = 600
 
@@ -23,54 +18,80 @@ tags = test,email
 [logging]
 level = DEBUG
 """
-    config_file.write_text(config_content)
+
+
+@pytest.fixture(scope="module")
+def sample_config_file(tmp_path_factory):
+    """Create a sample configuration file (read-only, shared)."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.ini"
+    config_file.write_text(SAMPLE_INI)
     return str(config_file)
 
 
 @pytest.fixture
-def empty_config_file(tmp_path):
-    """Create an empty configuration file."""
-    config_file = tmp_path / "empty_config.ini"
-    config_file.write_text("")
-    return str(config_file)
+def mock_config_logger(monkeypatch):
+    """Swap the config module logger for a mock."""
+    logger_mock = mock.Mock()
+    monkeypatch.setattr("gmail2bear.config.logger", logger_mock)
+    return logger_mock
+
+
+@pytest.fixture(scope="module")
+def empty_config():
+    """Parse an empty configuration once for the defaults checks."""
+    return Config.from_string("")
+
+
+@pytest.fixture(scope="module")
+def sample_config():
+    """Parse the sample configuration once, without touching disk."""
+    return Config.from_string(SAMPLE_INI)
 
 
 def test_config_load_success(sample_config_file):
-    """Test that Config loads a valid configuration file."""
+    """Test that Config loads a valid configuration file from disk."""
     config = Config(sample_config_file)
     assert config.loaded is True
 
 
-def test_config_load_nonexistent():
-    """Test that Config handles nonexistent configuration file."""
-    with mock.patch("gmail2bear.config.logger") as mock_logger:
-        config = Config("nonexistent_file.ini")
+def test_config_from_string():
+    """Test that Config.from_string parses in-memory INI text."""
+    config = Config.from_string(SAMPLE_INI)
+    assert config.loaded is True
+    assert config.get_sender_email() == "test@example.com"
 
-    assert config.loaded is False
-    mock_logger.error.assert_called_once_with(mock.ANY)
+    bad = Config.from_string("not an ini [")
+    assert bad.loaded is False
 
 
-def test_config_get_sender_email(sample_config_file):
-    """Test that Config returns the correct sender email."""
-    config = Config(sample_config_file)
-    assert config.get_sender_email() == "test@example.com"
-
+def test_config_load_nonexistent(mock_config_logger):
+    """Test that Config handles nonexistent configuration file."""
+    config = Config("nonexistent_file.ini")
 
-def test_config_get_poll_interval(sample_config_file):
-    """Test that Config returns the correct poll interval."""
-    config = Config(sample_config_file)
-    assert config.get_poll_interval() == 600
+    assert config.loaded is False
+    mock_config_logger.error.assert_called_once_with(mock.ANY)
 
 
-def test_config_get_note_title_template(sample_config_file):
-    """Test that Config returns the correct note title template."""
-    config = Config(sample_config_file)
-    assert config.get_note_title_template() == "Test: {subject}"
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        ("get_sender_email", "test@example.com"),
+        ("get_poll_interval", 600),
+        ("get_note_title_template", "Test: {subject}"),
+        ("get_tags", ["test", "email"]),
+        ("get_logging_level", "DEBUG"),
+    ],
+)
+def test_config_getters(sample_config, method, expected):
+    """Test that the Config getters return the configured values."""
+    assert getattr(sample_config, method)() == expected
 
 
-def test_config_get_note_body_template(sample_config_file):
+def test_config_get_note_body_template():
     """Test that Config returns the correct note body template."""
-    config = Config(sample_config_file)
+    # Own instance: this test patches the parser and the cached getters
+    # would otherwise leak the patched value into the shared config
+    config = Config.from_string(SAMPLE_INI)
     expected = """# {subject}
 
 {body}
@@ -82,32 +103,19 @@ From: {sender}"""
         assert config.get_note_body_template() == expected
 
 
-def test_config_get_tags(sample_config_file):
-    """Test that Config returns the correct tags."""
-    config = Config(sample_config_file)
-    assert config.get_tags() == ["test", "email"]
-
-
-def test_config_get_logging_level(sample_config_file):
-    """Test that Config returns the correct logging level."""
-    config = Config(sample_config_file)
-    assert config.get_logging_level() == "DEBUG"
-
-
-def test_config_missing_section(empty_config_file):
+def test_config_missing_section(empty_config, mock_config_logger):
     """Test that Config handles missing sections."""
-    config = Config(empty_config_file)
+    config = empty_config
 
-    with mock.patch("gmail2bear.config.logger") as mock_logger:
-        assert config.get_sender_email() is None
-        assert config.get_poll_interval() == 300
-        assert config.get_note_title_template() == "Email: {subject}"
-        assert "# {subject}" in config.get_note_body_template()
-        assert config.get_tags() == ["email", "gmail"]
-        assert config.get_logging_level() == "INFO"
+    assert config.get_sender_email() is None
+    assert config.get_poll_interval() == 300
+    assert config.get_note_title_template() == "Email: {subject}"
+    assert "# {subject}" in config.get_note_body_template()
+    assert config.get_tags() == ["email", "gmail"]
+    assert config.get_logging_level() == "INFO"
 
     # Check that warnings were logged
-    assert mock_logger.warning.called or mock_logger.error.called
+    assert mock_config_logger.warning.called or mock_config_logger.error.called
 
 
 def test_config_create_default(tmp_path):
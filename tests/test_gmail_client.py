@@ -1,28 +1,88 @@
 """Tests for the Gmail client module."""
 
 import base64
+import types
 from unittest import mock
 
 import pytest
 from gmail2bear.gmail_client import GmailClient
 from googleapiclient.errors import HttpError
 
+# Message body payloads encoded once at import; the fixtures below are
+# read-only, so the encoded strings never change
+_PLAIN_B64 = base64.b64encode(b"Test body").decode()
+_MULTI_PLAIN_B64 = base64.b64encode(b"Test plain body").decode()
+_MULTI_HTML_B64 = base64.b64encode(b"<p>Test HTML body</p>").decode()
 
-@pytest.fixture
-def mock_credentials():
-    """Create mock credentials."""
-    return mock.Mock()
+# Shared error for the error-path tests; exceptions re-raise cleanly, so
+# one instance avoids rebuilding the Mock response and parsing content
+_HTTP_500 = HttpError(resp=mock.Mock(status=500), content=b"Error")
 
 
 @pytest.fixture
-def gmail_client(mock_credentials):
-    """Create a Gmail client with mock credentials."""
-    return GmailClient(mock_credentials)
+def mock_gmail_logger(monkeypatch):
+    """Swap the gmail_client module logger for a mock."""
+    logger_mock = mock.Mock()
+    monkeypatch.setattr("gmail2bear.gmail_client.logger", logger_mock)
+    return logger_mock
+
+
+# GmailClient never inspects the credentials in these tests, so one
+# shared stand-in is enough — no fixture resolution needed
+_MOCK_CREDS = mock.Mock()
+
+
+@pytest.fixture(scope="module")
+def gmail_client():
+    """Create a Gmail client with mock credentials (shared).
+
+    Module-scoped because construction runs the discovery-based
+    service build, the slowest per-test step here; _reset_service
+    undoes the per-test service swaps.
+    """
+    return GmailClient(_MOCK_CREDS)
+
+
+@pytest.fixture(autouse=True)
+def _reset_service(gmail_client):
+    """Restore the client's real service after each test."""
+    saved = gmail_client.service
+    yield
+    gmail_client.service = saved
 
 
 @pytest.fixture
+def mocked_service(gmail_client):
+    """Attach a pre-wired mock service to the client.
+
+    Exposes the leaf execute mocks so tests configure return_value or
+    side_effect directly instead of rebuilding the users().messages()
+    attribute chain — each () on a fresh Mock allocates child mocks.
+    """
+    service = mock.Mock()
+    users = service.users.return_value
+    messages = users.messages.return_value
+    labels = users.labels.return_value
+    gmail_client.service = service
+    return types.SimpleNamespace(
+        service=service,
+        list_execute=messages.list.return_value.execute,
+        get=messages.get,
+        get_execute=messages.get.return_value.execute,
+        modify=messages.modify,
+        modify_execute=messages.modify.return_value.execute,
+        batch_modify=messages.batchModify,
+        history_list=users.history.return_value.list,
+        history_list_execute=users.history.return_value.list.return_value.execute,
+        labels_list_execute=labels.list.return_value.execute,
+        labels_create_execute=labels.create.return_value.execute,
+        profile_execute=users.getProfile.return_value.execute,
+    )
+
+
+@pytest.fixture(scope="module")
 def mock_message():
-    """Create a mock Gmail message."""
+    """Create a mock Gmail message (read-only, shared)."""
     return {
         "id": "12345",
         "labelIds": ["INBOX", "UNREAD"],
@@ -33,14 +93,14 @@ def mock_message():
                 {"name": "Date", "value": "Mon, 01 Jan 2023 12:00:00 +0000"},
             ],
             "mimeType": "text/plain",
-            "body": {"data": base64.b64encode(b"Test body").decode()},
+            "body": {"data": _PLAIN_B64},
         },
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_multipart_message():
-    """Create a mock multipart Gmail message."""
+    """Create a mock multipart Gmail message (read-only, shared)."""
     return {
         "id": "12345",
         "labelIds": ["INBOX", "UNREAD"],
@@ -54,26 +114,24 @@ def mock_multipart_message():
             "parts": [
                 {
                     "mimeType": "text/plain",
-                    "body": {"data": base64.b64encode(b"Test plain body").decode()},
+                    "body": {"data": _MULTI_PLAIN_B64},
                 },
                 {
                     "mimeType": "text/html",
-                    "body": {
-                        "data": base64.b64encode(b"<p>Test HTML body</p>").decode()
-                    },
+                    "body": {"data": _MULTI_HTML_B64},
                 },
             ],
         },
     }
 
 
-def test_gmail_client_init(gmail_client, mock_credentials):
+def test_gmail_client_init(gmail_client):
     """Test that GmailClient initializes correctly."""
     assert gmail_client.user_id == "me"
     assert gmail_client.service is not None
 
 
-def test_get_emails_from_sender_success(gmail_client):
+def test_get_emails_from_sender_success(gmail_client, mocked_service):
     """Test that get_emails_from_sender successfully retrieves emails."""
     # Mock the Gmail API responses
     mock_list_response = {"messages": [{"id": "12345"}, {"id": "67890"}]}
@@ -87,18 +145,23 @@ def test_get_emails_from_sender_success(gmail_client):
                 {"name": "Date", "value": "Mon, 01 Jan 2023 12:00:00 +0000"},
             ],
             "mimeType": "text/plain",
-            "body": {"data": base64.b64encode(b"Test body").decode()},
+            "body": {"data": _PLAIN_B64},
         },
     }
 
-    # Set up the mock service
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().list().execute.return_value = (
-        mock_list_response
-    )
-    gmail_client.service.users().messages().get().execute.return_value = (
-        mock_get_response
-    )
+    mocked_service.list_execute.return_value = mock_list_response
+
+    def fake_batch(callback):
+        batch = mock.Mock()
+        queued = []
+        batch.add.side_effect = lambda request, request_id: queued.append(request_id)
+        batch.execute.side_effect = lambda: [
+            callback(request_id, dict(mock_get_response, id=request_id), None)
+            for request_id in queued
+        ]
+        return batch
+
+    mocked_service.service.new_batch_http_request.side_effect = fake_batch
 
     # Call the method
     emails = gmail_client.get_emails_from_sender("sender@example.com", max_results=2)
@@ -112,16 +175,9 @@ def test_get_emails_from_sender_success(gmail_client):
     assert emails[0]["is_html"] is False
 
 
-def test_get_emails_from_sender_no_emails(gmail_client):
+def test_get_emails_from_sender_no_emails(gmail_client, mocked_service):
     """Test that get_emails_from_sender handles no emails."""
-    # Mock the Gmail API response
-    mock_list_response = {}
-
-    # Set up the mock service
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().list().execute.return_value = (
-        mock_list_response
-    )
+    mocked_service.list_execute.return_value = {}
 
     # Call the method
     emails = gmail_client.get_emails_from_sender("sender@example.com")
@@ -130,48 +186,38 @@ def test_get_emails_from_sender_no_emails(gmail_client):
     assert len(emails) == 0
 
 
-def test_get_emails_from_sender_http_error(gmail_client):
+def test_get_emails_from_sender_http_error(
+    gmail_client, mocked_service, mock_gmail_logger
+):
     """Test that get_emails_from_sender handles HTTP errors."""
-    # Set up the mock service to raise an error
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().list().execute.side_effect = HttpError(
-        resp=mock.Mock(status=500), content=b"Error"
-    )
+    mocked_service.list_execute.side_effect = _HTTP_500
 
-    with mock.patch("gmail2bear.gmail_client.logger") as mock_logger:
-        # Call the method
-        emails = gmail_client.get_emails_from_sender("sender@example.com")
+    emails = gmail_client.get_emails_from_sender("sender@example.com")
 
-    # Check the results
     assert len(emails) == 0
-    mock_logger.error.assert_called_once_with(mock.ANY)
+    mock_gmail_logger.error.assert_called_once_with(mock.ANY)
 
 
-def test_get_emails_from_sender_filter_processed(gmail_client):
+def test_get_emails_from_sender_filter_processed(gmail_client, mocked_service):
     """Test that get_emails_from_sender filters processed emails."""
-    # Mock the Gmail API response
-    mock_list_response = {"messages": [{"id": "12345"}, {"id": "67890"}]}
-
-    # Set up the mock service
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().list().execute.return_value = (
-        mock_list_response
-    )
+    mocked_service.list_execute.return_value = {
+        "messages": [{"id": "12345"}, {"id": "67890"}]
+    }
 
     # Call the method with processed IDs
     emails = gmail_client.get_emails_from_sender(
         "sender@example.com", processed_ids=["12345", "67890"]
     )
 
-    # Check the results
+    # Check the results: no messages and, more importantly, no get RPCs
+    # for ids that were filtered out before fetching
     assert len(emails) == 0
+    mocked_service.get.assert_not_called()
 
 
-def test_get_email_data_success(gmail_client, mock_message):
+def test_get_email_data_success(gmail_client, mocked_service, mock_message):
     """Test that _get_email_data successfully retrieves email data."""
-    # Set up the mock service
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().get().execute.return_value = mock_message
+    mocked_service.get_execute.return_value = mock_message
 
     # Call the method
     email_data = gmail_client._get_email_data("12345")
@@ -184,70 +230,166 @@ def test_get_email_data_success(gmail_client, mock_message):
     assert email_data["is_html"] is False
 
 
-def test_get_email_data_http_error(gmail_client):
+def test_get_email_data_http_error(gmail_client, mocked_service, mock_gmail_logger):
     """Test that _get_email_data handles HTTP errors."""
-    # Set up the mock service to raise an error
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().get().execute.side_effect = HttpError(
-        resp=mock.Mock(status=500), content=b"Error"
-    )
+    mocked_service.get_execute.side_effect = _HTTP_500
 
-    with mock.patch("gmail2bear.gmail_client.logger") as mock_logger:
-        # Call the method
-        email_data = gmail_client._get_email_data("12345")
+    email_data = gmail_client._get_email_data("12345")
 
-    # Check the results
     assert email_data is None
-    mock_logger.error.assert_called_once_with(mock.ANY)
-
+    mock_gmail_logger.error.assert_called_once_with(mock.ANY)
 
-def test_get_message_body_plain(gmail_client, mock_message):
-    """Test that _get_message_body extracts plain text body."""
-    # Call the method
-    body, is_html = gmail_client._get_message_body(mock_message)
 
-    # Check the results
-    assert body == "Test body"
-    assert is_html is False
+@pytest.mark.parametrize(
+    "message_fixture, expected_body",
+    [
+        ("mock_message", "Test body"),
+        ("mock_multipart_message", "Test plain body"),
+    ],
+)
+def test_get_message_body(gmail_client, message_fixture, expected_body, request):
+    """Test that _get_message_body extracts the plain text body."""
+    message = request.getfixturevalue(message_fixture)
 
+    body, is_html = gmail_client._get_message_body(message)
 
-def test_get_message_body_multipart(gmail_client, mock_multipart_message):
-    """Test that _get_message_body extracts body from multipart message."""
-    # Call the method
-    body, is_html = gmail_client._get_message_body(mock_multipart_message)
-
-    # Check the results
-    assert body == "Test plain body"
+    assert body == expected_body
     assert is_html is False
 
 
-def test_mark_as_read_success(gmail_client):
+def test_mark_as_read_success(gmail_client, mocked_service):
     """Test that mark_as_read successfully marks an email as read."""
-    # Set up the mock service
-    gmail_client.service = mock.Mock()
-
-    # Call the method
     result = gmail_client.mark_as_read("12345")
 
-    # Check the results
     assert result is True
-    gmail_client.service.users().messages().modify.assert_called_once_with(
+    mocked_service.modify.assert_called_once_with(
         userId="me", id="12345", body={"removeLabelIds": ["UNREAD"]}
     )
 
 
-def test_mark_as_read_error(gmail_client):
+def test_mark_as_read_error(gmail_client, mocked_service, mock_gmail_logger):
     """Test that mark_as_read handles errors."""
-    # Set up the mock service to raise an error
-    gmail_client.service = mock.Mock()
-    gmail_client.service.users().messages().modify().execute.side_effect = HttpError(
-        resp=mock.Mock(status=500), content=b"Error"
-    )
+    mocked_service.modify_execute.side_effect = _HTTP_500
 
-    with mock.patch("gmail2bear.gmail_client.logger") as mock_logger:
-        # Call the method
-        result = gmail_client.mark_as_read("12345")
+    result = gmail_client.mark_as_read("12345")
 
-    # Check the results
     assert result is False
-    mock_logger.error.assert_called_once_with(mock.ANY)
+    mock_gmail_logger.error.assert_called_once_with(mock.ANY)
+
+
+def test_ensure_label_existing(gmail_client, mocked_service):
+    """Test that ensure_label resolves and caches an existing label."""
+    mocked_service.labels_list_execute.return_value = {
+        "labels": [{"id": "Label_7", "name": "Existing"}]
+    }
+
+    assert gmail_client.ensure_label("Existing") == "Label_7"
+    # The second call is served from the cache without another list RPC
+    assert gmail_client.ensure_label("Existing") == "Label_7"
+    mocked_service.labels_list_execute.assert_called_once_with()
+
+
+def test_ensure_label_creates_missing(gmail_client, mocked_service):
+    """Test that ensure_label creates a label that does not exist yet."""
+    mocked_service.labels_list_execute.return_value = {"labels": []}
+    mocked_service.labels_create_execute.return_value = {"id": "Label_9"}
+
+    assert gmail_client.ensure_label("Missing") == "Label_9"
+
+
+def test_add_label_success(gmail_client, mocked_service):
+    """Test that add_label issues a modify with the label ID."""
+    assert gmail_client.add_label("12345", "Label_7") is True
+    mocked_service.modify.assert_called_once_with(
+        userId="me", id="12345", body={"addLabelIds": ["Label_7"]}
+    )
+
+
+def test_batch_mark_as_read_no_ids(gmail_client, mocked_service):
+    """Test that batch_mark_as_read skips the RPC for an empty list."""
+    assert gmail_client.batch_mark_as_read([]) is True
+    mocked_service.batch_modify.assert_not_called()
+
+
+def test_batch_mark_as_read_chunks_ids(gmail_client, mocked_service):
+    """Test that batch_mark_as_read splits IDs into 1000-ID batchModify calls."""
+    msg_ids = [f"id{i}" for i in range(2500)]
+
+    result = gmail_client.batch_mark_as_read(msg_ids, add_label_ids=["Label_7"])
+
+    assert result is True
+    bodies = [
+        call.kwargs["body"] for call in mocked_service.batch_modify.call_args_list
+    ]
+    assert [len(body["ids"]) for body in bodies] == [1000, 1000, 500]
+    assert all(body["removeLabelIds"] == ["UNREAD"] for body in bodies)
+    assert all(body["addLabelIds"] == ["Label_7"] for body in bodies)
+    assert [msg_id for body in bodies for msg_id in body["ids"]] == msg_ids
+
+
+def test_get_new_message_ids_since_success(gmail_client, mocked_service):
+    """Test that get_new_message_ids_since collects added message IDs."""
+    mocked_service.history_list_execute.return_value = {
+        "historyId": "2002",
+        "history": [
+            {
+                "messagesAdded": [
+                    {"message": {"id": "m1"}},
+                    {"message": {"id": "m2"}},
+                ]
+            }
+        ],
+    }
+
+    result = gmail_client.get_new_message_ids_since("2000")
+
+    assert result == (["m1", "m2"], "2002")
+    mocked_service.history_list.assert_called_once_with(
+        userId="me",
+        startHistoryId="2000",
+        historyTypes=["messageAdded"],
+        pageToken=None,
+    )
+
+
+def test_get_new_message_ids_since_expired(gmail_client, mocked_service):
+    """Test that an expired history ID (404) signals a full sync."""
+    mocked_service.history_list_execute.side_effect = HttpError(
+        resp=mock.Mock(status=404), content=b"notFound"
+    )
+
+    assert gmail_client.get_new_message_ids_since("1") is None
+
+
+def test_get_latest_history_id(gmail_client, mocked_service):
+    """Test that get_latest_history_id returns the profile's history ID."""
+    mocked_service.profile_execute.return_value = {"historyId": 12345}
+
+    assert gmail_client.get_latest_history_id() == "12345"
+
+
+def test_get_emails_by_ids_empty(gmail_client, mocked_service):
+    """Test that get_emails_by_ids skips the RPC for an empty list."""
+    assert gmail_client.get_emails_by_ids([]) == []
+    mocked_service.get.assert_not_called()
+
+
+def test_get_emails_by_ids_success(gmail_client, mocked_service, mock_message):
+    """Test that get_emails_by_ids returns emails in request order."""
+
+    def fake_batch(callback):
+        batch = mock.Mock()
+        queued = []
+        batch.add.side_effect = lambda request, request_id: queued.append(request_id)
+        batch.execute.side_effect = lambda: [
+            callback(request_id, dict(mock_message, id=request_id), None)
+            for request_id in queued
+        ]
+        return batch
+
+    mocked_service.service.new_batch_http_request.side_effect = fake_batch
+
+    emails = gmail_client.get_emails_by_ids(["a1", "b2"])
+
+    assert [email["id"] for email in emails] == ["a1", "b2"]
+    assert emails[0]["subject"] == "Test Subject"
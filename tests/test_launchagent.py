@@ -1,50 +1,24 @@
 """Tests for the launch agent manager."""
 
 import os
+
+# Keep the module-level import (no "from subprocess import run" anywhere):
+# tests patch "subprocess.run" by module path, and a from-import binding
+# would dodge the patch
 import subprocess
+import uuid
 from pathlib import Path
 from unittest import mock
 
 import pytest
 from gmail2bear.launchagent.manager import LaunchAgentManager
 
+# Shared subprocess results: tests only read .returncode, so two
+# module-level sentinels replace a fresh MagicMock per test
+_OK = mock.MagicMock(returncode=0)
+_FAIL = mock.MagicMock(returncode=1)
 
-@pytest.fixture
-def mock_paths(tmp_path):
-    """Create mock paths for testing."""
-    config_path = tmp_path / "config.ini"
-    credentials_path = tmp_path / "credentials.json"
-    token_path = tmp_path / "token.pickle"
-    state_path = tmp_path / "state.json"
-
-    # Create empty files
-    config_path.write_text("")
-    credentials_path.write_text("")
-    token_path.write_text("")
-    state_path.write_text("")
-
-    return {
-        "config_path": str(config_path),
-        "credentials_path": str(credentials_path),
-        "token_path": str(token_path),
-        "state_path": str(state_path),
-    }
-
-
-@pytest.fixture
-def launch_agent_manager(mock_paths):
-    """Create a launch agent manager with mock paths."""
-    with mock.patch("platform.system", return_value="Darwin"):
-        manager = LaunchAgentManager(
-            config_path=mock_paths["config_path"],
-            credentials_path=mock_paths["credentials_path"],
-            token_path=mock_paths["token_path"],
-            state_path=mock_paths["state_path"],
-            poll_interval=300,
-        )
-
-        # Mock the template path to use a temporary file
-        template_content = """<?xml version="1.0" encoding="UTF-8"?>
+_TEMPLATE_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
@@ -85,68 +59,150 @@ def launch_agent_manager(mock_paths):
 </dict>
 </plist>
 """
-        template_path = Path(mock_paths["config_path"]).parent / "template.plist"
-        template_path.write_text(template_content)
-        manager.template_path = str(template_path)
 
-        # Mock the plist path
-        plist_dir = Path(mock_paths["config_path"]).parent / "LaunchAgents"
-        plist_dir.mkdir(exist_ok=True)
-        manager.plist_path = str(plist_dir / "com.gmail2bear.plist")
 
-        return manager
+@pytest.fixture(autouse=True)
+def _darwin_platform(monkeypatch):
+    """Report macOS for every test in this module.
+
+    monkeypatch.setattr with a plain lambda skips MagicMock construction
+    and mock.patch's import/introspection machinery; tests that need a
+    different platform set their own attribute over it.
+    """
+    monkeypatch.setattr("platform.system", lambda: "Darwin")
+
+
+@pytest.fixture(scope="session")
+def template_plist(tmp_path_factory):
+    """Write the plist template once; it is never modified."""
+    template_path = tmp_path_factory.mktemp("launchagent-template") / "template.plist"
+    template_path.write_text(_TEMPLATE_CONTENT)
+    return str(template_path)
+
+
+@pytest.fixture(scope="session")
+def mock_paths(tmp_path_factory):
+    """Create mock paths for testing.
+
+    Session-scoped: the four files stay empty — tests only read the paths.
+    """
+    base = tmp_path_factory.mktemp("launchagent-paths")
+    paths = {}
+    for key, name in (
+        ("config_path", "config.ini"),
+        ("credentials_path", "credentials.json"),
+        ("token_path", "token.pickle"),
+        ("state_path", "state.json"),
+    ):
+        path = base / name
+        # touch() is enough: the manager only needs the files to exist,
+        # nothing reads their contents
+        path.touch()
+        paths[key] = str(path)
+
+    return paths
+
+
+@pytest.fixture(scope="session")
+def plist_dir(tmp_path_factory):
+    """Create the LaunchAgents directory once; plist names are per-test."""
+    return tmp_path_factory.mktemp("LaunchAgents")
+
+
+@pytest.fixture
+def launch_agent_manager(mock_paths, template_plist, plist_dir):
+    """Create a launch agent manager with mock paths."""
+    manager = LaunchAgentManager(
+        config_path=mock_paths["config_path"],
+        credentials_path=mock_paths["credentials_path"],
+        token_path=mock_paths["token_path"],
+        state_path=mock_paths["state_path"],
+        poll_interval=300,
+    )
+
+    # Reuse the cached template (read-only); a unique plist name keeps
+    # tests isolated without a per-test mkdir
+    manager.template_path = template_plist
+    manager.plist_path = str(plist_dir / f"com.gmail2bear.{uuid.uuid4().hex}.plist")
+
+    return manager
+
+
+@pytest.fixture
+def mock_subprocess_run():
+    """Patch subprocess.run once per test via start/stop.
+
+    The subprocess-driven tests share this instead of each opening its
+    own with-block; tests configure return_value/side_effect directly.
+    """
+    patcher = mock.patch("subprocess.run")
+    yield patcher.start()
+    patcher.stop()
+
+
+@pytest.fixture
+def patched_manager(launch_agent_manager):
+    """Manager with MagicMock stand-ins for the platform/agent helpers.
+
+    Plain attribute assignment on the instance shadows the class methods
+    without the per-test cost of nested mock.patch.object contexts; the
+    instance is function-scoped, so nothing needs restoring. Defaults
+    model an installed, idle agent on macOS — tests flip return_value
+    for the scenario under test.
+    """
+    launch_agent_manager.is_macos = mock.MagicMock(return_value=True)
+    launch_agent_manager.is_installed = mock.MagicMock(return_value=True)
+    launch_agent_manager.is_running = mock.MagicMock(return_value=False)
+    launch_agent_manager._load_agent = mock.MagicMock(return_value=True)
+    launch_agent_manager._unload_agent = mock.MagicMock(return_value=True)
+    return launch_agent_manager
 
 
 def test_init(mock_paths):
     """Test initialization of LaunchAgentManager."""
-    with mock.patch("platform.system", return_value="Darwin"):
-        manager = LaunchAgentManager(
-            config_path=mock_paths["config_path"],
-            credentials_path=mock_paths["credentials_path"],
-            token_path=mock_paths["token_path"],
-            state_path=mock_paths["state_path"],
-            poll_interval=300,
-        )
-
-        assert manager.config_path == os.path.abspath(
-            os.path.expanduser(mock_paths["config_path"])
-        )
-        assert manager.credentials_path == os.path.abspath(
-            os.path.expanduser(mock_paths["credentials_path"])
-        )
-        assert manager.token_path == os.path.abspath(
-            os.path.expanduser(mock_paths["token_path"])
-        )
-        assert manager.state_path == os.path.abspath(
-            os.path.expanduser(mock_paths["state_path"])
-        )
-        assert manager.poll_interval == 300
+    manager = LaunchAgentManager(
+        config_path=mock_paths["config_path"],
+        credentials_path=mock_paths["credentials_path"],
+        token_path=mock_paths["token_path"],
+        state_path=mock_paths["state_path"],
+        poll_interval=300,
+    )
+
+    # Normalize each path once rather than per assert line
+    expected = {
+        key: os.path.abspath(os.path.expanduser(value))
+        for key, value in mock_paths.items()
+    }
+    assert manager.config_path == expected["config_path"]
+    assert manager.credentials_path == expected["credentials_path"]
+    assert manager.token_path == expected["token_path"]
+    assert manager.state_path == expected["state_path"]
+    assert manager.poll_interval == 300
 
 
 def test_is_macos_true():
     """Test is_macos when on macOS."""
-    with mock.patch("platform.system", return_value="Darwin"):
-        manager = LaunchAgentManager(
-            config_path="config.ini",
-            credentials_path="credentials.json",
-            token_path="token.pickle",
-            state_path="state.json",
-        )
+    manager = LaunchAgentManager(
+        config_path="config.ini",
+        credentials_path="credentials.json",
+        token_path="token.pickle",
+        state_path="state.json",
+    )
 
-        assert manager.is_macos() is True
+    assert manager.is_macos() is True
 
 
-def test_is_macos_false():
+def test_is_macos_false(monkeypatch):
     """Test is_macos when not on macOS."""
-    with mock.patch("platform.system", return_value="Linux"):
-        manager = LaunchAgentManager(
-            config_path="config.ini",
-            credentials_path="credentials.json",
-            token_path="token.pickle",
-            state_path="state.json",
-        )
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    manager = LaunchAgentManager(
+        config_path="config.ini",
+        credentials_path="credentials.json",
+        token_path="token.pickle",
+        state_path="state.json",
+    )
 
-        assert manager.is_macos() is False
+    assert manager.is_macos() is False
 
 
 def test_is_installed_true(launch_agent_manager):
@@ -159,370 +215,232 @@ def test_is_installed_true(launch_agent_manager):
 
 def test_is_installed_false(launch_agent_manager):
     """Test is_installed when plist doesn't exist."""
-    # Ensure the plist file doesn't exist
-    if os.path.exists(launch_agent_manager.plist_path):
-        os.remove(launch_agent_manager.plist_path)
+    # Ensure the plist file doesn't exist (single unlink, no stat first)
+    Path(launch_agent_manager.plist_path).unlink(missing_ok=True)
 
     assert launch_agent_manager.is_installed() is False
 
 
 def test_is_running_not_installed(launch_agent_manager):
     """Test is_running when not installed."""
-    # Ensure the plist file doesn't exist
-    if os.path.exists(launch_agent_manager.plist_path):
-        os.remove(launch_agent_manager.plist_path)
+    # Ensure the plist file doesn't exist (single unlink, no stat first)
+    Path(launch_agent_manager.plist_path).unlink(missing_ok=True)
 
     assert launch_agent_manager.is_running() is False
 
 
-def test_is_running_true(launch_agent_manager):
+def test_is_running_true(launch_agent_manager, mock_subprocess_run):
     """Test is_running when running."""
-    # Create the plist file
-    Path(launch_agent_manager.plist_path).write_text("test")
+    # Installed-check stub; the file contents are never read
+    launch_agent_manager.is_installed = mock.MagicMock(return_value=True)
 
-    # Mock subprocess.run to return success
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.return_value = mock.MagicMock(returncode=0)
+    mock_subprocess_run.return_value = _OK
 
-        assert launch_agent_manager.is_running() is True
-        mock_run.assert_called_once()
+    assert launch_agent_manager.is_running() is True
+    mock_subprocess_run.assert_called_once()
 
 
-def test_is_running_false(launch_agent_manager):
+def test_is_running_false(launch_agent_manager, mock_subprocess_run):
     """Test is_running when not running."""
-    # Create the plist file
-    Path(launch_agent_manager.plist_path).write_text("test")
+    # Installed-check stub; the file contents are never read
+    launch_agent_manager.is_installed = mock.MagicMock(return_value=True)
 
-    # Mock subprocess.run to return failure
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.return_value = mock.MagicMock(returncode=1)
+    mock_subprocess_run.return_value = _FAIL
 
-        assert launch_agent_manager.is_running() is False
-        mock_run.assert_called_once()
+    assert launch_agent_manager.is_running() is False
+    mock_subprocess_run.assert_called_once()
 
 
-def test_is_running_error(launch_agent_manager):
+def test_is_running_error(launch_agent_manager, mock_subprocess_run):
     """Test is_running when subprocess raises an error."""
-    # Create the plist file
-    Path(launch_agent_manager.plist_path).write_text("test")
+    # Installed-check stub; the file contents are never read
+    launch_agent_manager.is_installed = mock.MagicMock(return_value=True)
+
+    mock_subprocess_run.side_effect = subprocess.SubprocessError("Test error")
+
+    assert launch_agent_manager.is_running() is False
+    mock_subprocess_run.assert_called_once()
+
 
-    # Mock subprocess.run to raise an exception
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.SubprocessError("Test error")
+@pytest.mark.parametrize("method", ["install", "uninstall", "start", "stop", "restart"])
+def test_not_macos(patched_manager, method):
+    """Test that every lifecycle method refuses to run off macOS."""
+    patched_manager.is_macos.return_value = False
 
-        assert launch_agent_manager.is_running() is False
-        mock_run.assert_called_once()
+    assert getattr(patched_manager, method)() is False
 
 
-def test_install_not_macos(launch_agent_manager):
-    """Test install when not on macOS."""
-    with mock.patch.object(launch_agent_manager, "is_macos", return_value=False):
-        assert launch_agent_manager.install() is False
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        # uninstall treats "nothing to remove" as success
+        ("uninstall", True),
+        ("start", False),
+        ("stop", False),
+        ("restart", False),
+    ],
+)
+def test_not_installed(patched_manager, method, expected):
+    """Test each lifecycle method when the agent is not installed."""
+    patched_manager.is_installed.return_value = False
 
+    assert getattr(patched_manager, method)() is expected
 
-def test_install_success(launch_agent_manager):
+
+def test_install_success(patched_manager):
     """Test successful installation."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "_load_agent", return_value=True
-    ), mock.patch(
-        "os.makedirs"
-    ) as mock_makedirs, mock.patch(
+    with mock.patch("os.makedirs") as mock_makedirs, mock.patch(
         "os.chmod"
     ) as mock_chmod:
-        assert launch_agent_manager.install() is True
+        assert patched_manager.install() is True
 
         # Verify directories were created
         assert mock_makedirs.call_count == 2
 
         # Verify file was created
-        assert os.path.exists(launch_agent_manager.plist_path)
+        assert os.path.exists(patched_manager.plist_path)
 
         # Verify permissions were set
-        mock_chmod.assert_called_once_with(launch_agent_manager.plist_path, 0o644)
+        mock_chmod.assert_called_once_with(patched_manager.plist_path, 0o644)
 
         # Verify agent was loaded
-        launch_agent_manager._load_agent.assert_called_once()
+        patched_manager._load_agent.assert_called_once()
 
 
-def test_install_error(launch_agent_manager):
+def test_install_error(patched_manager):
     """Test installation with error."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "_load_agent", side_effect=Exception("Test error")
-    ):
-        # The install method should catch the exception and return False
-        assert launch_agent_manager.install() is False
-
+    patched_manager._load_agent.side_effect = Exception("Test error")
 
-def test_uninstall_not_macos(launch_agent_manager):
-    """Test uninstall when not on macOS."""
-    with mock.patch.object(launch_agent_manager, "is_macos", return_value=False):
-        assert launch_agent_manager.uninstall() is False
+    # The install method should catch the exception and return False
+    assert patched_manager.install() is False
 
 
-def test_uninstall_not_installed(launch_agent_manager):
-    """Test uninstall when not installed."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(launch_agent_manager, "is_installed", return_value=False):
-        assert launch_agent_manager.uninstall() is True
-
-
-def test_uninstall_success(launch_agent_manager):
+def test_uninstall_success(patched_manager):
     """Test successful uninstallation."""
     # Create the plist file
-    Path(launch_agent_manager.plist_path).write_text("test")
+    Path(patched_manager.plist_path).write_text("test")
 
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(launch_agent_manager, "_unload_agent", return_value=True):
-        assert launch_agent_manager.uninstall() is True
+    assert patched_manager.uninstall() is True
 
-        # Verify agent was unloaded
-        launch_agent_manager._unload_agent.assert_called_once()
+    # Verify agent was unloaded
+    patched_manager._unload_agent.assert_called_once()
 
-        # Verify file was removed
-        assert not os.path.exists(launch_agent_manager.plist_path)
+    # Verify file was removed
+    assert not os.path.exists(patched_manager.plist_path)
 
 
-def test_uninstall_error(launch_agent_manager):
+def test_uninstall_error(patched_manager):
     """Test uninstallation with error."""
-    # Create the plist file
-    Path(launch_agent_manager.plist_path).write_text("test")
-
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "_unload_agent", return_value=True
-    ), mock.patch(
-        "os.remove"
-    ) as mock_remove:
+    # No plist on disk needed: is_installed is stubbed and remove is mocked
+    with mock.patch("os.remove") as mock_remove:
         # Make remove raise an exception
         mock_remove.side_effect = OSError("Test error")
 
-        assert launch_agent_manager.uninstall() is False
-
-
-def test_start_not_macos(launch_agent_manager):
-    """Test start when not on macOS."""
-    with mock.patch.object(launch_agent_manager, "is_macos", return_value=False):
-        assert launch_agent_manager.start() is False
-
+        assert patched_manager.uninstall() is False
 
-def test_start_not_installed(launch_agent_manager):
-    """Test start when not installed."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(launch_agent_manager, "is_installed", return_value=False):
-        assert launch_agent_manager.start() is False
 
-
-def test_start_already_running(launch_agent_manager):
+def test_start_already_running(patched_manager):
     """Test start when already running."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_running", return_value=True
-    ):
-        assert launch_agent_manager.start() is True
-
-
-def test_start_success(launch_agent_manager):
-    """Test successful start."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_running", return_value=False
-    ), mock.patch.object(
-        launch_agent_manager, "_load_agent", return_value=True
-    ):
-        assert launch_agent_manager.start() is True
-
-        # Verify agent was loaded
-        launch_agent_manager._load_agent.assert_called_once()
+    patched_manager.is_running.return_value = True
 
+    assert patched_manager.start() is True
 
-def test_stop_not_macos(launch_agent_manager):
-    """Test stop when not on macOS."""
-    with mock.patch.object(launch_agent_manager, "is_macos", return_value=False):
-        assert launch_agent_manager.stop() is False
 
+def test_start_success(patched_manager):
+    """Test successful start."""
+    assert patched_manager.start() is True
 
-def test_stop_not_installed(launch_agent_manager):
-    """Test stop when not installed."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(launch_agent_manager, "is_installed", return_value=False):
-        assert launch_agent_manager.stop() is False
+    # Verify agent was loaded
+    patched_manager._load_agent.assert_called_once()
 
 
-def test_stop_not_running(launch_agent_manager):
+def test_stop_not_running(patched_manager):
     """Test stop when not running."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_running", return_value=False
-    ):
-        assert launch_agent_manager.stop() is True
+    assert patched_manager.stop() is True
 
 
-def test_stop_success(launch_agent_manager):
+def test_stop_success(patched_manager):
     """Test successful stop."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_running", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "_unload_agent", return_value=True
-    ):
-        assert launch_agent_manager.stop() is True
-
-        # Verify agent was unloaded
-        launch_agent_manager._unload_agent.assert_called_once()
+    patched_manager.is_running.return_value = True
 
+    assert patched_manager.stop() is True
 
-def test_restart_not_macos(launch_agent_manager):
-    """Test restart when not on macOS."""
-    with mock.patch.object(launch_agent_manager, "is_macos", return_value=False):
-        assert launch_agent_manager.restart() is False
+    # Verify agent was unloaded
+    patched_manager._unload_agent.assert_called_once()
 
 
-def test_restart_not_installed(launch_agent_manager):
-    """Test restart when not installed."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(launch_agent_manager, "is_installed", return_value=False):
-        assert launch_agent_manager.restart() is False
-
-
-def test_restart_success(launch_agent_manager):
+def test_restart_success(patched_manager):
     """Test successful restart."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "stop", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "start", return_value=True
-    ):
-        assert launch_agent_manager.restart() is True
-
-        # Verify stop and start were called
-        launch_agent_manager.stop.assert_called_once()
-        launch_agent_manager.start.assert_called_once()
-
-
-def test_restart_stop_failure(launch_agent_manager):
-    """Test restart when stop fails."""
-    with mock.patch.object(
-        launch_agent_manager, "is_macos", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(
-        launch_agent_manager, "stop", return_value=False
-    ):
-        assert launch_agent_manager.restart() is False
-
-        # Verify stop was called but not start
-        launch_agent_manager.stop.assert_called_once()
-
-
-def test_load_agent_success(launch_agent_manager):
-    """Test successful agent loading."""
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.return_value = mock.MagicMock(returncode=0)
-
-        assert launch_agent_manager._load_agent() is True
-
-        # Verify subprocess.run was called with correct arguments
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[0] == "launchctl"
-        assert args[1] == "load"
-        # The third argument should be the plist path, not "-w"
-        assert args[2] == launch_agent_manager.plist_path
-
-
-def test_load_agent_failure(launch_agent_manager):
-    """Test agent loading failure."""
-    with mock.patch("subprocess.run") as mock_run:
-        # Set up the mock to raise CalledProcessError
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1, cmd=["launchctl", "load"], stderr="Test error"
-        )
-
-        assert launch_agent_manager._load_agent() is False
-
-
-def test_load_agent_error(launch_agent_manager):
-    """Test agent loading with subprocess error."""
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.SubprocessError("Test error")
+    patched_manager.stop = mock.MagicMock(return_value=True)
+    patched_manager.start = mock.MagicMock(return_value=True)
 
-        assert launch_agent_manager._load_agent() is False
+    assert patched_manager.restart() is True
 
-        # Verify subprocess.run was called
-        mock_run.assert_called_once()
+    # Verify stop and start were called
+    patched_manager.stop.assert_called_once()
+    patched_manager.start.assert_called_once()
 
 
-def test_unload_agent_success(launch_agent_manager):
-    """Test successful agent unloading."""
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.return_value = mock.MagicMock(returncode=0)
-
-        assert launch_agent_manager._unload_agent() is True
-
-        # Verify subprocess.run was called with correct arguments
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[0] == "launchctl"
-        assert args[1] == "unload"
-        # The third argument should be the plist path, not "-w"
-        assert args[2] == launch_agent_manager.plist_path
-
-
-def test_unload_agent_failure(launch_agent_manager):
-    """Test agent unloading failure."""
-    with mock.patch("subprocess.run") as mock_run:
-        # Set up the mock to raise CalledProcessError
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1, cmd=["launchctl", "unload"], stderr="Test error"
-        )
-
-        assert launch_agent_manager._unload_agent() is False
-
-
-def test_unload_agent_error(launch_agent_manager):
-    """Test agent unloading with subprocess error."""
-    with mock.patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.SubprocessError("Test error")
-
-        assert launch_agent_manager._unload_agent() is False
-
-        # Verify subprocess.run was called
-        mock_run.assert_called_once()
+def test_restart_stop_failure(patched_manager):
+    """Test restart when stop fails."""
+    patched_manager.stop = mock.MagicMock(return_value=False)
+
+    assert patched_manager.restart() is False
+
+    # Verify stop was called but not start
+    patched_manager.stop.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "action, launchctl_arg", [("_load_agent", "load"), ("_unload_agent", "unload")]
+)
+@pytest.mark.parametrize(
+    "run_config, expected",
+    [
+        ({"return_value": _OK}, True),
+        (
+            {
+                "side_effect": subprocess.CalledProcessError(
+                    returncode=1, cmd=["launchctl"], stderr="Test error"
+                )
+            },
+            False,
+        ),
+        ({"side_effect": subprocess.SubprocessError("Test error")}, False),
+    ],
+    ids=["success", "called-process-error", "subprocess-error"],
+)
+def test_agent_load_unload(
+    launch_agent_manager,
+    mock_subprocess_run,
+    action,
+    launchctl_arg,
+    run_config,
+    expected,
+):
+    """Test _load_agent/_unload_agent across subprocess outcomes."""
+    mock_subprocess_run.configure_mock(**run_config)
+
+    assert getattr(launch_agent_manager, action)() is expected
+
+    # One call, correct argv; the third argument should be the plist
+    # path, not "-w"
+    assert mock_subprocess_run.call_count == 1
+    args = mock_subprocess_run.call_args.args[0]
+    assert args[:3] == [
+        "launchctl",
+        launchctl_arg,
+        launch_agent_manager.plist_path,
+    ]
+
+
+def test_get_status(patched_manager):
+    """Test getting service status."""
+    patched_manager.is_running.return_value = True
 
+    status = patched_manager.get_status()
 
-def test_get_status(launch_agent_manager):
-    """Test getting service status."""
-    with mock.patch.object(
-        launch_agent_manager, "is_installed", return_value=True
-    ), mock.patch.object(launch_agent_manager, "is_running", return_value=True):
-        status = launch_agent_manager.get_status()
-
-        assert status["installed"] is True
-        assert status["running"] is True
-        assert "plist_path" in status
-        assert status["plist_path"] == launch_agent_manager.plist_path
+    assert status["installed"] is True
+    assert status["running"] is True
+    assert "plist_path" in status
+    assert status["plist_path"] == patched_manager.plist_path
@@ -1,5 +1,6 @@
 """Tests for the processor module."""
 
+import logging
 import platform
 from unittest import mock
 
@@ -36,12 +37,8 @@ skip_on_non_macos = pytest.mark.skipif(
     platform.system() != "Darwin", reason="Bear tests only run on macOS"
 )
 
-
-@pytest.fixture
-def mock_config_path(tmp_path):
-    """Create a mock config path."""
-    config_file = tmp_path / "config.ini"
-    config_content = """[gmail]
+# Encoded once at import; write_bytes skips the per-write encoding pass
+_CONFIG_BYTES = b"""[gmail]
 sender_email = test@example.com
 poll_interval = 60
 
@@ -58,29 +55,39 @@ tags = test,email
 [logging]
 level = DEBUG
 """
-    config_file.write_text(config_content)
+
+
+@pytest.fixture(scope="session")
+def mock_config_path(tmp_path_factory):
+    """Create a mock config path (read-only, shared)."""
+    config_file = tmp_path_factory.mktemp("processor-config") / "config.ini"
+    config_file.write_bytes(_CONFIG_BYTES)
     return str(config_file)
 
 
-@pytest.fixture
-def mock_credentials_path(tmp_path):
-    """Create a mock credentials path."""
-    credentials_file = tmp_path / "credentials.json"
+@pytest.fixture(scope="session")
+def mock_credentials_path(tmp_path_factory):
+    """Create a mock credentials path (read-only, shared)."""
+    credentials_file = tmp_path_factory.mktemp("processor-creds") / "credentials.json"
     credentials_file.write_text('{"installed": {"client_id": "test"}}')
     return str(credentials_file)
 
 
 @pytest.fixture
 def mock_state_path(tmp_path):
-    """Create a mock state path."""
+    """Create a mock state path.
+
+    Function-scoped on purpose: tests drive a real StateManager, so each
+    needs its own state file for isolation.
+    """
     state_file = tmp_path / "state.json"
     return str(state_file)
 
 
-@pytest.fixture
-def mock_token_path(tmp_path):
-    """Create a mock token path."""
-    token_file = tmp_path / "token.pickle"
+@pytest.fixture(scope="session")
+def mock_token_path(tmp_path_factory):
+    """Create a mock token path (never written by these tests)."""
+    token_file = tmp_path_factory.mktemp("processor-token") / "token.pickle"
     return str(token_file)
 
 
@@ -88,35 +95,37 @@ def mock_token_path(tmp_path):
 def processor(
     mock_config_path, mock_credentials_path, mock_state_path, mock_token_path
 ):
-    """Create a processor with mock paths."""
-    if platform.system() == "Darwin":
-        with mock.patch("gmail2bear.processor.BearClient") as mock_bear_client_class:
-            # Set up the mock BearClient instance
-            mock_bear_client = mock.MagicMock()
-            mock_bear_client_class.return_value = mock_bear_client
-
-            processor = EmailProcessor(
-                config_path=mock_config_path,
-                credentials_path=mock_credentials_path,
-                state_path=mock_state_path,
-                token_path=mock_token_path,
-            )
-
-            # Return the processor with the mocked BearClient
-            return processor
-    else:
-        # On non-macOS platforms, return a dummy processor
-        return EmailProcessor(
-            config_path=mock_config_path,
-            credentials_path=mock_credentials_path,
-            state_path=mock_state_path,
-            token_path=mock_token_path,
-        )
+    """Create a processor with mock paths.
+
+    Components are swapped by plain attribute assignment (as in
+    test_processor_notifications.py) so tests configure return values
+    directly instead of stacking mock.patch contexts.
+    """
+    processor = EmailProcessor(
+        config_path=mock_config_path,
+        credentials_path=mock_credentials_path,
+        state_path=mock_state_path,
+        token_path=mock_token_path,
+    )
+
+    processor.bear_client = mock.MagicMock()
+    processor.config = mock.MagicMock()
+    processor.config.loaded = True
+    processor.config.should_archive_emails.return_value = False
+    # authenticate() probes these via hasattr, which a bare MagicMock
+    # always satisfies — pin the values the real default config returns
+    processor.config.get_keychain_enabled.return_value = False
+    processor.config.get_keychain_service_name.return_value = "Gmail to Bear"
+    return processor
 
 
 @pytest.fixture
 def mock_email():
-    """Create a mock email dictionary."""
+    """Create a mock email dictionary.
+
+    Function-scoped: _process_single_email rewrites the date (and an
+    HTML body) in place, so a shared dict would leak between tests.
+    """
     return {
         "id": "12345",
         "subject": "Test Subject",
@@ -159,51 +168,46 @@ def test_authenticate_success(processor):
     )
 
 
-def test_authenticate_failure(processor):
+def test_authenticate_failure(processor, caplog):
     """Test that authenticate handles authentication failures."""
+    caplog.set_level(logging.ERROR, logger="gmail2bear.processor")
     with mock.patch("gmail2bear.processor.get_credentials") as mock_get_credentials:
         mock_get_credentials.side_effect = Exception("Authentication failed")
 
-        with mock.patch("gmail2bear.processor.logger") as mock_logger:
-            result = processor.authenticate()
+        result = processor.authenticate()
 
     assert result is False
     assert processor.gmail_client is None
-    mock_logger.error.assert_called_once_with(mock.ANY)
-
+    assert any(record.levelno == logging.ERROR for record in caplog.records)
 
-def test_process_emails_no_config(processor):
-    """Test that process_emails handles missing configuration."""
-    # Mock the loaded property
-    with mock.patch.object(processor.config, "loaded", False, create=True):
-        with mock.patch("gmail2bear.processor.logger") as mock_logger:
-            result = processor.process_emails()
 
-    assert result == 0
-    mock_logger.error.assert_called_once_with(mock.ANY)
+def _break_no_config(processor):
+    processor.config.loaded = False
 
 
-def test_process_emails_no_gmail_client(processor):
-    """Test that process_emails handles missing Gmail client."""
+def _break_no_gmail_client(processor):
     processor.gmail_client = None
 
-    with mock.patch("gmail2bear.processor.logger") as mock_logger:
-        result = processor.process_emails()
 
-    assert result == 0
-    mock_logger.error.assert_called_once_with(mock.ANY)
+def _break_no_sender_email(processor):
+    processor.gmail_client = mock.Mock()
+    processor.config.get_sender_email.return_value = None
 
 
-def test_process_emails_no_sender_email(processor):
-    """Test that process_emails handles missing sender email."""
-    processor.gmail_client = mock.Mock()
+@pytest.mark.parametrize(
+    "break_precondition",
+    [_break_no_config, _break_no_gmail_client, _break_no_sender_email],
+    ids=["no_config", "no_gmail_client", "no_sender_email"],
+)
+def test_process_emails_missing_precondition(processor, caplog, break_precondition):
+    """Test that process_emails bails out when a precondition is missing."""
+    caplog.set_level(logging.ERROR, logger="gmail2bear.processor")
+    break_precondition(processor)
 
-    with mock.patch("gmail2bear.processor.logger") as mock_logger:
-        with mock.patch.object(processor.config, "get_sender_email", return_value=None):
-            result = processor.process_emails()
+    result = processor.process_emails()
 
     assert result == 0
-    mock_logger.error.assert_called_once_with(mock.ANY)
+    assert any(record.levelno == logging.ERROR for record in caplog.records)
 
 
 def test_process_emails_success(processor, mock_email):
@@ -211,37 +215,37 @@ def test_process_emails_success(processor, mock_email):
     # Set up mocks
     processor.gmail_client = mock.Mock()
     processor.gmail_client.get_emails_from_sender.return_value = [mock_email]
-
-    # Mock the loaded property
-    with mock.patch.object(processor.config, "loaded", True, create=True):
-        with mock.patch.object(
-            processor, "_process_single_email", return_value=True
-        ) as mock_process:
-            with mock.patch.object(
-                processor.config, "get_sender_email", return_value="test@example.com"
-            ):
-                result = processor.process_emails(once=True)
+    # The overlapped prefetch follows the incremental history path once
+    # the first fetch seeds a cursor; give it a well-formed empty result
+    # so the test exercises the success path, not the error handler
+    processor.gmail_client.get_latest_history_id.return_value = "1"
+    processor.gmail_client.get_new_message_ids_since.return_value = ([], "1")
+    processor.gmail_client.get_emails_by_ids.return_value = []
+    processor.config.get_sender_email.return_value = "test@example.com"
+    mock_process = mock.Mock(return_value=True)
+    processor._process_single_email = mock_process
+
+    result = processor.process_emails(once=True)
 
     assert result == 1
     mock_process.assert_called_once_with(mock_email)
+    # The history cursor was stored, not a stringified Mock from an
+    # unpacking failure swallowed by the error handler
+    assert processor.state_manager.last_history_id == "1"
 
 
-def test_process_emails_no_emails(processor):
+def test_process_emails_no_emails(processor, caplog):
     """Test that process_emails handles no emails."""
     # Set up mocks
     processor.gmail_client = mock.Mock()
     processor.gmail_client.get_emails_from_sender.return_value = []
+    processor.config.get_sender_email.return_value = "test@example.com"
+    caplog.set_level(logging.INFO, logger="gmail2bear.processor")
 
-    # Mock the loaded property and sender_email
-    with mock.patch.object(processor.config, "loaded", True, create=True):
-        with mock.patch.object(
-            processor.config, "get_sender_email", return_value="test@example.com"
-        ):
-            with mock.patch("gmail2bear.processor.logger") as mock_logger:
-                result = processor.process_emails(once=True)
+    result = processor.process_emails(once=True)
 
     assert result == 0
-    mock_logger.info.assert_any_call("No new emails to process")
+    assert "No new emails to process" in caplog.messages
 
 
 @skip_on_non_macos
@@ -250,80 +254,69 @@ def test_process_single_email_success(processor, mock_email):
     # Set up mocks
     processor.gmail_client = mock.Mock()
     processor.bear_client.create_note.return_value = True
+    processor.config.get_tags.return_value = ["test", "email"]
+    mock_title = mock.Mock(return_value="Test Title")
+    mock_body = mock.Mock(return_value="Test Body")
+    processor._format_note_title = mock_title
+    processor._format_note_body = mock_body
 
-    with mock.patch.object(
-        processor, "_format_note_title", return_value="Test Title"
-    ) as mock_title:
-        with mock.patch.object(
-            processor, "_format_note_body", return_value="Test Body"
-        ) as mock_body:
-            with mock.patch.object(
-                processor.config, "get_tags", return_value=["test", "email"]
-            ):
-                result = processor._process_single_email(mock_email)
+    result = processor._process_single_email(mock_email)
 
     assert result is True
     mock_title.assert_called_once_with(mock_email)
     mock_body.assert_called_once_with(mock_email)
     processor.bear_client.create_note.assert_called_once()
-    processor.gmail_client.mark_as_read.assert_called_once_with(mock_email["id"])
+    assert mock_email["id"] in processor._pending_read_ids
     assert processor.state_manager.is_processed(mock_email["id"])
 
 
-def test_process_single_email_already_processed(processor, mock_email):
-    """Test that _process_single_email skips already processed emails."""
+def test_process_emails_skips_already_processed(processor, mock_email):
+    """Test that process_emails filters out already processed emails."""
     # Mark the email as already processed
     processor.state_manager.mark_as_processed(mock_email["id"])
+    processor.gmail_client = mock.Mock()
+    processor.gmail_client.get_emails_from_sender.return_value = [mock_email]
+    processor.config.get_sender_email.return_value = "test@example.com"
+    mock_process = mock.Mock(return_value=True)
+    processor._process_single_email = mock_process
 
-    with mock.patch("gmail2bear.processor.logger") as mock_logger:
-        result = processor._process_single_email(mock_email)
+    result = processor.process_emails(once=True)
 
-    assert result is False
-    mock_logger.debug.assert_called_once_with(mock.ANY)
+    assert result == 0
+    mock_process.assert_not_called()
 
 
 @skip_on_non_macos
-def test_process_single_email_bear_failure(processor, mock_email):
+def test_process_single_email_bear_failure(processor, mock_email, caplog):
     """Test that _process_single_email handles Bear note creation failures."""
     # Set up mocks
     processor.bear_client.create_note.return_value = False
+    processor.config.get_tags.return_value = ["test", "email"]
+    processor._format_note_title = mock.Mock(return_value="Test Title")
+    processor._format_note_body = mock.Mock(return_value="Test Body")
+    caplog.set_level(logging.ERROR, logger="gmail2bear.processor")
 
-    with mock.patch("gmail2bear.processor.logger") as mock_logger:
-        with mock.patch.object(
-            processor, "_format_note_title", return_value="Test Title"
-        ):
-            with mock.patch.object(
-                processor, "_format_note_body", return_value="Test Body"
-            ):
-                with mock.patch.object(
-                    processor.config, "get_tags", return_value=["test", "email"]
-                ):
-                    result = processor._process_single_email(mock_email)
+    result = processor._process_single_email(mock_email)
 
     assert result is False
-    mock_logger.error.assert_called_once_with(mock.ANY)
+    assert any(record.levelno == logging.ERROR for record in caplog.records)
     assert not processor.state_manager.is_processed(mock_email["id"])
 
 
 def test_format_note_title(processor, mock_email):
     """Test that _format_note_title correctly formats the note title."""
     # Test with simple template
-    with mock.patch.object(
-        processor.config,
-        "get_note_title_template",
-        return_value="Email: {subject} from {sender}",
-    ):
-        title = processor._format_note_title(mock_email)
+    template = processor.config.get_note_title_template
+    template.return_value = "Email: {subject} from {sender}"
+
+    title = processor._format_note_title(mock_email)
 
     assert title == "Email: Test Subject from sender@example.com"
 
     # Test with date formatting
-    with mock.patch.object(
-        processor.config,
-        "get_note_title_template",
-        return_value="Email: {subject} on {date:%Y-%m-%d}",
-    ):
-        title = processor._format_note_title(mock_email)
+    template.return_value = "Email: {subject} on {date:%Y-%m-%d}"
+
+    title = processor._format_note_title(mock_email)
 
     assert "Email: Test Subject on 2023-01-01" in title
 
@@ -331,12 +324,12 @@ def test_format_note_title(processor, mock_email):
 def test_format_note_body(processor, mock_email):
     """Test that _format_note_body correctly formats the note body."""
     # Test with simple template
-    template = "# {subject}\n\nFrom: {sender}\nDate: {date}\n\n{body}\n\nID: {id}"
+    template = processor.config.get_note_body_template
+    template.return_value = (
+        "# {subject}\n\nFrom: {sender}\nDate: {date}\n\n{body}\n\nID: {id}"
+    )
 
-    with mock.patch.object(
-        processor.config, "get_note_body_template", return_value=template
-    ):
-        body = processor._format_note_body(mock_email)
+    body = processor._format_note_body(mock_email)
 
     assert "# Test Subject" in body
     assert "From: sender@example.com" in body
@@ -345,14 +338,11 @@ def test_format_note_body(processor, mock_email):
     assert "ID: 12345" in body
 
     # Test with date formatting
-    template = (
+    template.return_value = (
         "# {subject}\n\nFrom: {sender}\nDate: {date:%Y-%m-%d}\n\n{body}\n\nID: {id}"
     )
 
-    with mock.patch.object(
-        processor.config, "get_note_body_template", return_value=template
-    ):
-        body = processor._format_note_body(mock_email)
+    body = processor._format_note_body(mock_email)
 
     assert "# Test Subject" in body
     assert "From: sender@example.com" in body
@@ -1,14 +1,13 @@
 """Tests for the processor module's notification behavior."""
 
-import os
-import tempfile
+import copy
 from unittest.mock import MagicMock, patch
 
 import pytest
 from gmail2bear.processor import EmailProcessor
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     """Create a mock configuration."""
     config = MagicMock()
@@ -25,16 +24,19 @@ def mock_config():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_state_manager():
     """Create a mock state manager."""
     state_manager = MagicMock()
     state_manager.get_processed_ids.return_value = []
     state_manager.is_processed.return_value = False
+    # No stored history ID, so fetches take the full-query path instead
+    # of unpacking an auto-created MagicMock as (ids, history_id)
+    state_manager.last_history_id = None
     return state_manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_bear_client():
     """Create a mock Bear client."""
     bear_client = MagicMock()
@@ -42,7 +44,7 @@ def mock_bear_client():
     return bear_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gmail_client():
     """Create a mock Gmail client."""
     gmail_client = MagicMock()
@@ -59,46 +61,63 @@ def mock_gmail_client():
     return gmail_client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_config, mock_state_manager, mock_bear_client, mock_gmail_client):
+    """Clear call history on the shared mocks, keeping configured returns."""
+    yield
+    for shared_mock in (
+        mock_config,
+        mock_state_manager,
+        mock_bear_client,
+        mock_gmail_client,
+    ):
+        shared_mock.reset_mock(return_value=False, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def _processor_prototype(tmp_path_factory):
+    """Build one real EmailProcessor for the module.
+
+    Construction re-reads the config file and wires every component, so
+    it runs once; the function-scoped fixture hands out shallow copies.
+    """
+    base = tmp_path_factory.mktemp("processor")
+    paths = {}
+    for name in ("config.ini", "credentials.json", "state.json", "token.pickle"):
+        path = base / name
+        path.touch()
+        paths[name] = str(path)
+
+    return EmailProcessor(
+        config_path=paths["config.ini"],
+        credentials_path=paths["credentials.json"],
+        state_path=paths["state.json"],
+        token_path=paths["token.pickle"],
+    )
+
+
 @pytest.fixture
-def processor(mock_config, mock_state_manager, mock_bear_client, mock_gmail_client):
+def processor(
+    _processor_prototype,
+    mock_config,
+    mock_state_manager,
+    mock_bear_client,
+    mock_gmail_client,
+):
     """Create a processor with mocked dependencies."""
-    # Create temporary files
-    with tempfile.NamedTemporaryFile(
-        delete=False
-    ) as config_file, tempfile.NamedTemporaryFile(
-        delete=False
-    ) as credentials_file, tempfile.NamedTemporaryFile(
-        delete=False
-    ) as state_file, tempfile.NamedTemporaryFile(
-        delete=False
-    ) as token_file:
-        config_path = config_file.name
-        credentials_path = credentials_file.name
-        state_path = state_file.name
-        token_path = token_file.name
-
-    # Create processor
-    processor = EmailProcessor(
-        config_path=config_path,
-        credentials_path=credentials_path,
-        state_path=state_path,
-        token_path=token_path,
-    )
+    processor = copy.copy(_processor_prototype)
 
-    # Replace components with mocks
+    # Replace components with mocks; rebind mutable per-run state so
+    # copies never share it with the prototype
     processor.config = mock_config
     processor.state_manager = mock_state_manager
     processor.bear_client = mock_bear_client
     processor.gmail_client = mock_gmail_client
     processor.notification_manager = MagicMock()
     processor.credentials = MagicMock()
+    processor._pending_read_ids = []
 
-    yield processor
-
-    # Clean up temporary files
-    for path in [config_path, credentials_path, state_path, token_path]:
-        if os.path.exists(path):
-            os.unlink(path)
+    return processor
 
 
 def test_process_emails_with_notification(processor):
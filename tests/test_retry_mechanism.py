@@ -1,6 +1,5 @@
 """Tests for the retry mechanism and error handling improvements."""
 
-import time
 from unittest import mock
 
 import pytest
@@ -8,92 +7,173 @@ from gmail2bear.gmail_client import GmailClient
 from gmail2bear.processor import EmailProcessor, retry_on_failure
 from googleapiclient.errors import HttpError
 
+# Shared errors for the retry tests; exceptions re-raise cleanly, so one
+# instance per status avoids rebuilding the Mock response each test
+_HTTP_503 = HttpError(resp=mock.Mock(status=503), content=b"Service Unavailable")
+_HTTP_404 = HttpError(resp=mock.Mock(status=404), content=b"Not Found")
 
-def test_retry_on_failure_decorator():
+# GmailClient never inspects the credentials here, so one shared
+# stand-in is enough
+_MOCK_CREDS = mock.Mock()
+
+# Fixed timestamp for the backoff test; freezing the clock turns the
+# backoff-elapsed check into a pure comparison
+_FROZEN_TIME = 1_700_000_000.0
+
+
+def _named_mock(side_effect):
+    """Build a retry-target Mock with the __name__ functools.wraps needs."""
+    mock_func = mock.Mock(side_effect=side_effect)
+    mock_func.__name__ = "mock_func"
+    return mock_func
+
+
+@pytest.fixture
+def gmail_client(monkeypatch):
+    """Create a Gmail client with a mocked service build."""
+    monkeypatch.setattr(
+        "gmail2bear.gmail_client.build", mock.Mock(return_value=mock.Mock())
+    )
+    return GmailClient(_MOCK_CREDS)
+
+
+@pytest.fixture(scope="session")
+def scaffold_paths(tmp_path_factory):
+    """Write the config/credentials/state files once for the session.
+
+    The processor tests only read them, so there is no need to recreate
+    the trio under a fresh tmp_path per test.
+    """
+    base = tmp_path_factory.mktemp("retry-scaffold")
+    config_file = base / "config.ini"
+    config_file.write_text("[gmail]\nsender_email = test@example.com")
+    credentials_file = base / "credentials.json"
+    credentials_file.write_text('{"installed": {"client_id": "test"}}')
+    state_file = base / "state.txt"
+    state_file.touch()
+    return str(config_file), str(credentials_file), str(state_file)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_processor_deps():
+    """Patch the processor's collaborators once for the whole module.
+
+    The processor tests below only need EmailProcessor construction to
+    skip its real dependencies; one module-level patch.multiple replaces
+    the four nested mock.patch enters per test.
+    """
+    with mock.patch.multiple(
+        "gmail2bear.processor",
+        BearClient=mock.DEFAULT,
+        NotificationManager=mock.DEFAULT,
+        get_credentials=mock.DEFAULT,
+        GmailClient=mock.DEFAULT,
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    """Stub time.sleep so retry backoff runs at CPU speed.
+
+    Every retry path in this module otherwise blocks for the real
+    backoff interval between attempts.
+    """
+    with mock.patch("time.sleep") as sleep:
+        yield sleep
+
+
+def test_retry_on_failure_decorator(mock_sleep):
     """Test that the retry_on_failure decorator works correctly."""
-    mock_func = mock.Mock()
-    mock_func.side_effect = [ConnectionError("Test error"), "success"]
-    mock_func.__name__ = "mock_func"  # Add __name__ attribute to the mock
+    mock_func = _named_mock([ConnectionError("Test error"), "success"])
 
     # Apply the decorator
-    decorated_func = retry_on_failure(max_retries=2, initial_backoff=0.1)(mock_func)
+    decorated_func = retry_on_failure(max_retries=2)(mock_func)
 
     # Call the decorated function
     result = decorated_func()
 
-    # Verify the function was called twice
+    # Verify the function was called twice, with one backoff in between
     assert mock_func.call_count == 2
     assert result == "success"
+    assert mock_sleep.call_count == 1
 
 
-def test_retry_on_failure_max_retries():
+def test_retry_on_failure_max_retries(mock_sleep):
     """Test that the retry_on_failure decorator respects max_retries."""
-    mock_func = mock.Mock()
-    mock_func.side_effect = [
-        ConnectionError("Error 1"),
-        ConnectionError("Error 2"),
-        ConnectionError("Error 3"),
-        "success",
-    ]
-    mock_func.__name__ = "mock_func"  # Add __name__ attribute to the mock
+    mock_func = _named_mock(
+        [
+            ConnectionError("Error 1"),
+            ConnectionError("Error 2"),
+            ConnectionError("Error 3"),
+            "success",
+        ]
+    )
 
     # Apply the decorator with max_retries=2
-    decorated_func = retry_on_failure(max_retries=2, initial_backoff=0.1)(mock_func)
+    decorated_func = retry_on_failure(max_retries=2)(mock_func)
 
     # Call the decorated function, should raise after 3 attempts (initial + 2 retries)
     with pytest.raises(ConnectionError):
         decorated_func()
 
-    # Verify the function was called 3 times
+    # Verify the function was called 3 times, with a backoff after each failure
     assert mock_func.call_count == 3
+    assert mock_sleep.call_count == 2
 
 
-def test_retry_on_failure_different_exception():
+def test_retry_on_failure_different_exception(mock_sleep):
     """Test that the retry_on_failure decorator only retries specified exceptions."""
-    mock_func = mock.Mock()
-    mock_func.side_effect = ValueError("Wrong exception")
+    mock_func = _named_mock(ValueError("Wrong exception"))
 
     # Apply the decorator with retry_exceptions=(ConnectionError,)
     decorated_func = retry_on_failure(
-        max_retries=2, initial_backoff=0.1, retry_exceptions=(ConnectionError,)
+        max_retries=2, retry_exceptions=(ConnectionError,)
     )(mock_func)
 
     # Call the decorated function, should raise immediately
     with pytest.raises(ValueError):
         decorated_func()
 
-    # Verify the function was called only once
+    # Verify the function was called only once, with no backoff
     assert mock_func.call_count == 1
+    assert mock_sleep.call_count == 0
 
 
-def test_gmail_client_execute_with_retry(monkeypatch):
-    """Test that the GmailClient._execute_with_retry method works correctly."""
-    # Create a mock credentials object
-    mock_credentials = mock.Mock()
+@pytest.mark.parametrize(
+    "max_retries, initial_backoff, expected_sleeps",
+    [
+        (2, 0.1, [0.1, 0.2]),
+        (3, 0.1, [0.1, 0.2, 0.4]),
+    ],
+)
+def test_retry_backoff_schedule(
+    mock_sleep, max_retries, initial_backoff, expected_sleeps
+):
+    """Test that retries follow the exponential backoff schedule."""
+    mock_func = _named_mock(ConnectionError("always fails"))
 
-    # Create a mock service
-    mock_service = mock.Mock()
+    decorated_func = retry_on_failure(
+        max_retries=max_retries, initial_backoff=initial_backoff
+    )(mock_func)
 
-    # Create a real HttpError for the first two attempts
-    mock_resp = mock.Mock()
-    mock_resp.status = 503  # Service Unavailable
-    http_error = HttpError(resp=mock_resp, content=b"Service Unavailable")
+    with pytest.raises(ConnectionError):
+        decorated_func()
 
-    # Mock the build function to return our mock service
-    monkeypatch.setattr(
-        "gmail2bear.gmail_client.build", mock.Mock(return_value=mock_service)
-    )
+    # Each delay is the scheduled backoff plus at most 10% jitter
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays == [pytest.approx(d, rel=0.1) for d in expected_sleeps]
 
-    # Create a GmailClient instance
-    client = GmailClient(mock_credentials)
 
+def test_gmail_client_execute_with_retry(gmail_client):
+    """Test that the GmailClient._execute_with_retry method works correctly."""
     # Create a mock request function that fails twice then succeeds
     mock_request = mock.Mock()
-    mock_request.side_effect = [http_error, http_error, "success"]
+    mock_request.side_effect = [_HTTP_503, _HTTP_503, "success"]
 
     # Call _execute_with_retry
     with mock.patch("time.sleep") as mock_sleep:  # Mock sleep to speed up test
-        result = client._execute_with_retry(mock_request, max_retries=3)
+        result = gmail_client._execute_with_retry(mock_request, max_retries=3)
 
     # Verify the request was called 3 times
     assert mock_request.call_count == 3
@@ -103,35 +183,16 @@ def test_gmail_client_execute_with_retry(monkeypatch):
     assert mock_sleep.call_count == 2
 
 
-def test_gmail_client_execute_with_retry_non_transient_error(monkeypatch):
+def test_gmail_client_execute_with_retry_non_transient_error(gmail_client):
     """Test that non-transient errors are not retried."""
-    # Create a mock credentials object
-    mock_credentials = mock.Mock()
-
-    # Create a mock service
-    mock_service = mock.Mock()
-
-    # Create a real HttpError with a non-transient status code
-    mock_resp = mock.Mock()
-    mock_resp.status = 404  # Not Found
-    http_error = HttpError(resp=mock_resp, content=b"Not Found")
-
-    # Mock the build function to return our mock service
-    monkeypatch.setattr(
-        "gmail2bear.gmail_client.build", mock.Mock(return_value=mock_service)
-    )
-
-    # Create a GmailClient instance
-    client = GmailClient(mock_credentials)
-
-    # Create a mock request function that fails
+    # Create a mock request function that fails with a non-transient status
     mock_request = mock.Mock()
-    mock_request.side_effect = http_error
+    mock_request.side_effect = _HTTP_404
 
     # Call _execute_with_retry, should raise immediately
     with mock.patch("time.sleep") as mock_sleep:
         with pytest.raises(HttpError):
-            client._execute_with_retry(mock_request, max_retries=3)
+            gmail_client._execute_with_retry(mock_request, max_retries=3)
 
     # Verify the request was called only once
     assert mock_request.call_count == 1
@@ -140,85 +201,63 @@ def test_gmail_client_execute_with_retry_non_transient_error(monkeypatch):
     assert mock_sleep.call_count == 0
 
 
-def test_processor_network_check_multiple_dns_servers(monkeypatch, tmp_path):
+def test_processor_network_check_multiple_dns_servers(monkeypatch, scaffold_paths):
     """Test that the network check tries multiple DNS servers."""
-    # Create temporary files for the processor
-    config_file = tmp_path / "config.ini"
-    config_file.write_text("[gmail]\nsender_email = test@example.com")
+    config_file, credentials_file, state_file = scaffold_paths
 
-    credentials_file = tmp_path / "credentials.json"
-    credentials_file.write_text('{"installed": {"client_id": "test"}}')
+    # Create a processor instance (collaborators patched module-wide)
+    processor = EmailProcessor(
+        config_path=config_file,
+        credentials_path=credentials_file,
+        state_path=state_file,
+    )
 
-    state_file = tmp_path / "state.txt"
-    state_file.touch()
+    # Mock socket.create_connection to fail for the first DNS server but succeed
+    # for the second
+    def mock_create_connection(address, timeout):
+        if address == ("8.8.8.8", 53):  # Google DNS
+            raise OSError("Connection failed")
+        return mock.Mock()  # Return a mock socket for other addresses
 
-    # Create a processor instance with mock components
-    with mock.patch("gmail2bear.processor.BearClient"), mock.patch(
-        "gmail2bear.processor.NotificationManager"
-    ), mock.patch("gmail2bear.processor.get_credentials"), mock.patch(
-        "gmail2bear.processor.GmailClient"
-    ):
-        processor = EmailProcessor(
-            config_path=str(config_file),
-            credentials_path=str(credentials_file),
-            state_path=str(state_file),
-        )
+    monkeypatch.setattr("socket.create_connection", mock_create_connection)
 
-        # Mock socket.create_connection to fail for the first DNS server but succeed for the second
-        def mock_create_connection(address, timeout):
-            if address == ("8.8.8.8", 53):  # Google DNS
-                raise OSError("Connection failed")
-            return mock.Mock()  # Return a mock socket for other addresses
+    # Check network availability
+    result = processor._is_network_available()
 
-        monkeypatch.setattr("socket.create_connection", mock_create_connection)
+    # Verify result is True (second DNS server succeeded)
+    assert result is True
 
-        # Check network availability
-        result = processor._is_network_available()
 
-        # Verify result is True (second DNS server succeeded)
-        assert result is True
+def test_processor_consecutive_errors_backoff(monkeypatch, scaffold_paths):
+    """Test that the processor enters error backoff after consecutive errors."""
+    config_file, credentials_file, state_file = scaffold_paths
 
+    # Create a processor instance (collaborators patched module-wide)
+    processor = EmailProcessor(
+        config_path=config_file,
+        credentials_path=credentials_file,
+        state_path=state_file,
+    )
 
-def test_processor_consecutive_errors_backoff(monkeypatch, tmp_path):
-    """Test that the processor enters error backoff after consecutive errors."""
-    # Create temporary files for the processor
-    config_file = tmp_path / "config.ini"
-    config_file.write_text("[gmail]\nsender_email = test@example.com")
+    # Freeze the clock so the backoff window deterministically covers the run
+    monkeypatch.setattr("time.time", lambda: _FROZEN_TIME)
 
-    credentials_file = tmp_path / "credentials.json"
-    credentials_file.write_text('{"installed": {"client_id": "test"}}')
+    # Set up processor state
+    processor.running = True
+    processor.consecutive_errors = processor.max_consecutive_errors
+    processor.last_error_time = _FROZEN_TIME
 
-    state_file = tmp_path / "state.txt"
-    state_file.touch()
+    # Mock methods
+    processor._check_config = mock.Mock()
+    processor._check_network = mock.Mock()
+    processor.process_emails = mock.Mock()
+    processor._interruptible_sleep = mock.Mock(side_effect=KeyboardInterrupt())
 
-    # Create a processor instance with mock components
-    with mock.patch("gmail2bear.processor.BearClient"), mock.patch(
-        "gmail2bear.processor.NotificationManager"
-    ), mock.patch("gmail2bear.processor.get_credentials"), mock.patch(
-        "gmail2bear.processor.GmailClient"
-    ):
-        processor = EmailProcessor(
-            config_path=str(config_file),
-            credentials_path=str(credentials_file),
-            state_path=str(state_file),
-        )
-
-        # Set up processor state
-        processor.running = True
-        processor.consecutive_errors = processor.max_consecutive_errors
-        processor.last_error_time = time.time()
-
-        # Mock methods
-        processor._check_config = mock.Mock()
-        processor._check_network = mock.Mock()
-        processor.process_emails = mock.Mock()
-        processor._interruptible_sleep = mock.Mock(side_effect=KeyboardInterrupt())
-
-        # Run the service
-        processor.run_service()
-
-        # Verify process_emails was not called due to being in error backoff
-        processor.process_emails.assert_not_called()
-
-        # Verify _interruptible_sleep was called
-        processor._interruptible_sleep.assert_called_once()
+    # Run the service
+    processor.run_service()
+
+    # Verify process_emails was not called due to being in error backoff
+    processor.process_emails.assert_not_called()
+
+    # Verify _interruptible_sleep was called
+    processor._interruptible_sleep.assert_called_once()
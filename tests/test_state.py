@@ -31,30 +31,28 @@ def corrupt_state_file(tmp_path):
     return str(state_file)
 
 
-def test_state_manager_init_new(state_file_path):
-    """Test that StateManager initializes with a new state file."""
-    with mock.patch("gmail2bear.state.logger") as mock_logger:
-        state_manager = StateManager(state_file_path)
-
-    assert os.path.exists(state_file_path)
-    assert state_manager.processed_ids == set()
-    mock_logger.debug.assert_called()
-
-
-def test_state_manager_init_existing(existing_state_file):
-    """Test that StateManager loads an existing state file."""
-    state_manager = StateManager(existing_state_file)
+@pytest.mark.parametrize(
+    "file_fixture, expected_ids, expect_error",
+    [
+        ("state_file_path", set(), False),
+        ("existing_state_file", {"id1", "id2", "id3"}, False),
+        ("corrupt_state_file", set(), True),
+    ],
+    ids=["new", "existing", "corrupt"],
+)
+def test_state_manager_init(request, file_fixture, expected_ids, expect_error):
+    """Test StateManager initialization against each state-file variant."""
+    path = request.getfixturevalue(file_fixture)
 
-    assert state_manager.processed_ids == {"id1", "id2", "id3"}
-
-
-def test_state_manager_init_corrupt(corrupt_state_file):
-    """Test that StateManager handles a corrupt state file."""
     with mock.patch("gmail2bear.state.logger") as mock_logger:
-        state_manager = StateManager(corrupt_state_file)
+        state_manager = StateManager(path)
 
-    assert state_manager.processed_ids == set()
-    mock_logger.error.assert_called_once_with(mock.ANY)
+    assert os.path.exists(path)
+    assert state_manager.processed_ids == expected_ids
+    if expect_error:
+        mock_logger.error.assert_called_once_with(mock.ANY)
+    else:
+        mock_logger.error.assert_not_called()
 
 
 def test_state_manager_is_processed(existing_state_file):
@@ -76,12 +74,36 @@ def test_state_manager_mark_as_processed(state_file_path):
 
     assert state_manager.is_processed("new_id") is True
 
-    # Check that the state was saved to the file
+    # Check that the ID was appended to the log sidecar
+    with open(state_file_path + ".log") as f:
+        assert "new_id" in f.read().splitlines()
+
+
+def test_state_manager_compact(state_file_path):
+    """Test that compact folds the log into the JSON snapshot."""
+    state_manager = StateManager(state_file_path)
+
+    state_manager.mark_as_processed("new_id")
+    state_manager.compact()
+
+    assert not os.path.exists(state_file_path + ".log")
     with open(state_file_path) as f:
         state_data = json.load(f)
         assert "new_id" in state_data["processed_ids"]
 
 
+def test_state_manager_replays_log(state_file_path):
+    """Test that StateManager replays log entries left by a previous run."""
+    state_manager = StateManager(state_file_path)
+    state_manager.mark_as_processed("logged_id")
+
+    reloaded = StateManager(state_file_path)
+
+    assert reloaded.is_processed("logged_id") is True
+    # Startup compaction folds the log into the snapshot
+    assert not os.path.exists(state_file_path + ".log")
+
+
 def test_state_manager_get_processed_ids(existing_state_file):
     """Test that StateManager returns the correct list of processed IDs."""
     state_manager = StateManager(existing_state_file)